@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Compare building the annotation row by row with ``create_annotation``.
+
+Run with ``python benchmarks/bench_annotation.py``.
+"""
+import timeit
+
+import mne
+import numpy as np
+import pandas as pd
+
+from sktime_neuro.utils.mne_processing import create_annotation
+
+
+def make_raw(n_events=100000, sfreq=100, seed=42):
+    """Create a short raw object with n_events synthetic annotations."""
+    rng = np.random.RandomState(seed)
+    info = mne.create_info(ch_names=["C3", "Cz", "C4"], ch_types="eeg", sfreq=sfreq)
+    n_timepoints = (n_events // 10 + 1) * sfreq
+    raw = mne.io.RawArray(np.zeros((3, n_timepoints)), info, verbose=False)
+    onsets = np.sort(rng.uniform(0, n_timepoints / sfreq - 1, n_events))
+    descriptions = rng.choice(["left", "right", "feet", "tongue", "rest"], n_events)
+    raw.set_annotations(mne.Annotations(onsets, 0.5, descriptions))
+    return raw
+
+
+def create_annotation_loop(raw):
+    """Previous implementation, one DataFrame row per event."""
+    annotation_pandas = pd.DataFrame(columns=["onset", "duration", "description"])
+    for idx, event in enumerate(raw.annotations):
+        annotation_pandas.loc[idx] = [
+            event["onset"],
+            event["duration"],
+            event["description"],
+        ]
+    return annotation_pandas
+
+
+if __name__ == "__main__":
+    raw = make_raw()
+    n_events = len(raw.annotations)
+    # the row by row version is far too slow for all events
+    small = raw.copy().crop(0, 200)
+    n_loop = len(small.annotations)
+    t = timeit.repeat(lambda: create_annotation_loop(small), number=1, repeat=3)
+    print(f"loop ({n_loop:d} events) : {min(t) * 1000:9.1f} ms")
+    for kwargs in [{}, {"categorical": False}, {"sample_index": True}]:
+        t = timeit.repeat(lambda: create_annotation(raw, **kwargs), number=1)
+        print(f"vectorized {kwargs} ({n_events:d} events): {min(t) * 1000:9.1f} ms")
+    memory = create_annotation(raw).memory_usage(deep=True).sum()
+    print(f"memory categorical: {memory / 1e6:.1f} MB")
+    memory = create_annotation(raw, categorical=False).memory_usage(deep=True).sum()
+    print(f"memory object     : {memory / 1e6:.1f} MB")
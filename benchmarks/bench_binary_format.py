@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Compare writing and loading a dataset as .ts text and in the binary format.
+
+Run with ``python benchmarks/bench_binary_format.py``.
+"""
+import os
+import tempfile
+import time
+
+from bench_tswriter import make_jagged
+from sktime.datasets import load_from_tsfile_to_dataframe
+
+from sktime_neuro.datasets.conversion.binary import (
+    load_npy_dataset,
+    write_jagged_to_npy_dataset,
+)
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+
+
+def _size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, f))
+        for root, _, files in os.walk(path)
+        for f in files
+    )
+
+
+if __name__ == "__main__":
+    data, values = make_jagged(n_cases=200)
+    with tempfile.TemporaryDirectory() as path:
+        ts, npy = os.path.join(path, "ts"), os.path.join(path, "npy")
+        start = time.perf_counter()
+        write_jaggeddf_to_tsfile(data, ts, "bench", class_value_list=values)
+        print(f"write .ts    : {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        write_jagged_to_npy_dataset(data, npy, "bench", values)
+        print(f"write binary : {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        load_from_tsfile_to_dataframe(os.path.join(ts, "bench", "bench.ts"))
+        print(f"load .ts     : {time.perf_counter() - start:8.3f} s")
+        for return_type in ["jagged", "nested_univ"]:
+            start = time.perf_counter()
+            load_npy_dataset(npy, "bench", return_type=return_type)
+            print(f"load {return_type:<12}: {time.perf_counter() - start:8.3f} s")
+        print(f"size .ts     : {_size(ts) / 1e6:8.1f} MB")
+        print(f"size binary  : {_size(npy) / 1e6:8.1f} MB")
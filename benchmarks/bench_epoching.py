@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Compare the loop and the vectorized implementation of ``epoch``.
+
+Run with ``python benchmarks/bench_epoching.py``.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sktime_neuro.transformations.series_to_panel.eeg_epoching import epoch
+
+
+def make_recording(n_events=20000, n_channels=32, sfreq=250, seed=42):
+    """Create a synthetic recording with one marker every two seconds."""
+    rng = np.random.RandomState(seed)
+    n_timepoints = (2 * n_events + 4) * sfreq
+    Z = rng.randn(n_timepoints, n_channels)
+    annotation = pd.DataFrame(
+        {
+            "onset": 2.0 * np.arange(1, n_events + 1),
+            "duration": 0.0,
+            "description": rng.choice(["left", "right", "rest"], n_events),
+        }
+    )
+    return Z, annotation
+
+
+if __name__ == "__main__":
+    sfreq = 250
+    interval = (-0.5, 1.5)
+    Z, annotation = make_recording(sfreq=sfreq)
+    labels = ["left", "right", "rest"]
+    for method, copy in [("loop", True), ("vectorized", True), ("vectorized", False)]:
+        t = timeit.repeat(
+            lambda: epoch(Z, annotation, labels, interval, sfreq, method, copy),
+            number=1,
+            repeat=3,
+        )
+        print(f"{method:<10} copy={copy!s:<5}: {min(t) * 1000:9.1f} ms")
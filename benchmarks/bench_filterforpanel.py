@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Compare the mne and the batched backend of ``FilterforPanel``.
+
+Run with ``python benchmarks/bench_filterforpanel.py``.
+"""
+import timeit
+
+import mne
+import numpy as np
+
+from sktime_neuro.transformations.panel.filterforpanel import FilterforPanel
+
+if __name__ == "__main__":
+    mne.set_log_level("ERROR")
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(2000, 32, 500)
+    out = np.empty(X.shape, dtype=np.float32)
+    for kwargs in [{}, {"method": "iir"}]:
+        for backend, dtype in [
+            ("mne", "float64"),
+            ("batched", "float64"),
+            ("batched", "float32"),
+        ]:
+            Filter = FilterforPanel(
+                sfreq=250, l_freq=1, h_freq=30, backend=backend, dtype=dtype, **kwargs
+            ).fit(X)
+            target = out if dtype == "float32" else None
+            t = timeit.repeat(
+                lambda: Filter.transform(X, out=target), number=1, repeat=3
+            )
+            method = kwargs.get("method", "fir")
+            print(f"{method} {backend:<8} {dtype}: {min(t) * 1000:9.1f} ms")
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Compare time and peak memory of a sequential and a fused preprocessing chain.
+
+Run with ``python benchmarks/bench_fusedpipeline.py``.
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from sktime_neuro.transformations.panel.baselinecorrection import (
+    BaselineCorrectionTransformer,
+)
+from sktime_neuro.transformations.panel.fusedpipeline import FusedPanelPipeline
+from sktime_neuro.transformations.panel.paneldownsampling import PanelDownsampling
+from sktime_neuro.transformations.panel.timeslicing import TimeSlicingTransformer
+
+
+def sequential(steps, X):
+    for step in steps:
+        X = step.fit(X).transform(X)
+    return X
+
+
+def fused(steps, X):
+    return FusedPanelPipeline(steps).fit_transform(X)
+
+
+if __name__ == "__main__":
+    np.random.seed(42)
+    X = np.random.randn(2000, 32, 1000)
+    steps = [
+        TimeSlicingTransformer(start=0.5, end=3.5, fs=250),
+        BaselineCorrectionTransformer(lower=0, upper=0.5, fs=250),
+        PanelDownsampling(factor=2),
+    ]
+    print(f"input: {X.nbytes / 1e6:.0f} MB")
+    for name, run in [("sequential", sequential), ("fused", fused)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        run(steps, X)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<10}: {elapsed * 1000:7.1f} ms, peak {peak / 1e6:7.1f} MB")
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Compare the per-value and the buffered row formatting of the .ts writer.
+
+Run with ``python benchmarks/bench_tswriter.py``.
+"""
+import itertools
+import tempfile
+import time
+
+import numpy as np
+
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+
+
+def make_jagged(n_cases=500, n_channels=2, length=5000, seed=42):
+    """Create jagged cases of n_channels series with varying length."""
+    rng = np.random.RandomState(seed)
+    data = []
+    for _ in range(n_cases):
+        n = rng.randint(length // 2, 3 * length // 2)
+        data.append([rng.randn(n) * 50 for _ in range(n_channels)])
+    return data, rng.randint(1, 6, n_cases)
+
+
+def write_loop(data, path, class_value_list, missing_values="NaN"):
+    """Core of the previous implementation, one str() per value."""
+    with open(path, "w") as file:
+        for case, value in itertools.zip_longest(data, class_value_list):
+            for dimension in case:
+                series = ",".join(
+                    [
+                        str(num) if not np.isnan(num) else missing_values
+                        for num in dimension
+                    ]
+                )
+                file.write(str(series))
+                file.write(":")
+            file.write(f"{value}")
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    data, values = make_jagged()
+    n_values = sum(len(d) for case in data for d in case)
+    print(f"{n_values / 1e6:.1f} million values")
+    with tempfile.TemporaryDirectory() as path:
+        start = time.perf_counter()
+        write_loop(data, f"{path}/loop.ts", values)
+        print(f"per value      : {time.perf_counter() - start:6.2f} s")
+        for precision in [None, 6]:
+            start = time.perf_counter()
+            write_jaggeddf_to_tsfile(
+                data, path, "bench", class_value_list=values, precision=precision
+            )
+            print(f"precision={precision!s:<5}: {time.perf_counter() - start:6.2f} s")
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Cross-validated train estimates with the folds fitted in parallel."""
+__all__ = ["cross_val_train_probs"]
+
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone
+from sklearn.model_selection import check_cv
+from threadpoolctl import threadpool_limits
+
+from sktime_neuro.benchmarking.instrumentation import measure
+
+
+def cross_val_train_probs(
+    classifier,
+    X,
+    y,
+    cv=10,
+    n_jobs=1,
+    threads_per_fold=None,
+    fold_model_dir=None,
+    trace_memory=False,
+):
+    """Estimate the class probabilities of the train data by cross-validation.
+
+    Gives the same probabilities as ``sklearn.model_selection.cross_val_predict``
+    with method="predict_proba", but the folds can run in parallel, each with its
+    BLAS and OpenMP threads limited to threads_per_fold, so that n_jobs folds
+    use about n_jobs * threads_per_fold cores.
+
+    Parameters
+    ----------
+    classifier : BaseClassifier
+        Classifier to estimate the probabilities of, it is cloned for each fold.
+    X : pd.DataFrame or np.array
+        The train data.
+    y : np.array
+        Train data class labels.
+    cv : int or cross-validation generator, default=10
+        Number of folds or splitter, like for ``cross_val_predict``, an int gives
+        stratified folds without shuffling.
+    n_jobs : int, default=1
+        Number of folds fitted at the same time, in separate processes.
+    threads_per_fold : int or None, default=None
+        Limit of the BLAS and OpenMP threads of each fold. If None, the CPUs are
+        shared among the parallel folds, and folds run one after the other are
+        not limited.
+    fold_model_dir : str or None, default=None
+        Directory to keep the fitted fold models in. A fold model stored there by
+        an earlier run with the same classifier parameters is loaded instead of
+        refitting the fold, so the directory must be specific to the train data.
+        Fold models are not kept if None.
+    trace_memory : bool, default=False
+        Whether to trace the memory allocated in each fold with tracemalloc.
+
+    Returns
+    -------
+    probs : np.array
+        Probabilities of shape cases*classes, columns in the order of np.unique(y).
+    folds : list of dict
+        Resources of each fold as from ``measure``, for "fit" and "predict_proba",
+        with the number of train and test cases and whether the model was reused.
+    """
+    y = np.asarray(y)
+    classes = np.unique(y)
+    splits = list(check_cv(cv, y, classifier=True).split(X, y))
+    params = str(classifier.get_params())
+    n_jobs = effective_n_jobs(n_jobs)
+    if threads_per_fold is None and n_jobs > 1:
+        threads_per_fold = max(os.cpu_count() // n_jobs, 1)
+    if fold_model_dir is not None:
+        os.makedirs(fold_model_dir, exist_ok=True)
+
+    # clone before sending, so a fitted classifier is not pickled for every fold
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_predict_fold)(
+            clone(classifier),
+            _take(X, train),
+            y[train],
+            _take(X, test),
+            threads_per_fold,
+            params,
+            None
+            if fold_model_dir is None
+            else os.path.join(fold_model_dir, f"fold{i}.joblib"),
+            trace_memory,
+        )
+        for i, (train, test) in enumerate(splits)
+    )
+
+    probs = np.zeros((len(y), len(classes)))
+    folds = []
+    for (train, test), (fold_probs, fold_classes, resources) in zip(splits, results):
+        # a fold without some class has fewer columns, as in cross_val_predict
+        columns = np.searchsorted(classes, fold_classes)
+        probs[np.ix_(test, columns)] = fold_probs
+        resources["n_train"] = len(train)
+        resources["n_test"] = len(test)
+        folds.append(resources)
+    return probs, folds
+
+
+def _take(X, indices):
+    """Return the cases of X at indices."""
+    if isinstance(X, pd.DataFrame):
+        return X.iloc[indices].reset_index(drop=True)
+    return X[indices]
+
+
+def _fit_and_predict_fold(
+    classifier, X_train, y_train, X_test, threads, params, model_file, trace_memory
+):
+    """Fit the unfitted classifier on one fold and predict its test cases."""
+    resources = {"reused": False}
+    model = _load_fold_model(model_file, params, y_train)
+    with threadpool_limits(limits=threads):
+        with measure(trace_memory) as resources["fit"]:
+            if model is None:
+                model = classifier
+                model.fit(X_train, y_train)
+            else:
+                resources["reused"] = True
+        with measure(trace_memory) as resources["predict_proba"]:
+            probs = model.predict_proba(X_test)
+    if model_file is not None and not resources["reused"]:
+        joblib.dump({"params": params, "y": y_train, "model": model}, model_file)
+    return probs, model.classes_, resources
+
+
+def _load_fold_model(model_file, params, y_train):
+    """Return the stored fold model if it was fitted alike, else None."""
+    if model_file is None or not os.path.exists(model_file):
+        return None
+    stored = joblib.load(model_file)
+    if stored["params"] != params or not np.array_equal(stored["y"], y_train):
+        return None
+    return stored["model"]
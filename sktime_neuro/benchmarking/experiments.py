@@ -11,17 +11,22 @@ __all__ = [
     "run_classification_experiment",
     "load_and_run_classification_experiment",
     "set_classifier",
+    "run_classification_experiments",
+    "load_dataset",
+    "clear_dataset_cache",
 ]
 
 
+import json
 import os
+import sys
 import time
+from collections import OrderedDict
 
 import numpy as np
 from sklearn import preprocessing
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
-from sklearn.model_selection import cross_val_predict
 
 from sktime.classification.dictionary_based import (
     BOSSEnsemble,
@@ -58,9 +63,42 @@ from sktime.classification.shapelet_based import (
     MrSEQLClassifier,
 )
 from sktime.clustering import TimeSeriesKMeans, TimeSeriesKMedoids
-from sktime.utils.data_io import load_from_tsfile_to_dataframe as load_ts
+from sktime.datasets import load_unit_test
 from sktime.utils.data_io import write_results_to_uea_format
-from sktime.utils.sampling import stratified_resample
+
+from sktime_neuro.benchmarking.cross_validation import cross_val_train_probs
+from sktime_neuro.benchmarking.instrumentation import measure
+from sktime_neuro.benchmarking.resampling import StratifiedResampler
+from sktime_neuro.benchmarking.scheduler import (
+    _missing_results,
+    run_classification_experiments,
+)
+from sktime_neuro.utils import dataset_cache
+from sktime_neuro.utils.dataset_cache import load_dataset
+
+# resamplers of the datasets, so the indices of each class are only found once
+_resamplers = OrderedDict()
+
+
+def clear_dataset_cache():
+    """Remove all datasets kept in memory by load_dataset and their resamplers."""
+    dataset_cache.clear_dataset_cache()
+    _resamplers.clear()
+
+
+def _resampler(trainX, trainY, testX, testY):
+    """Return a resampler for a dataset, reused for the datasets of load_dataset."""
+    # the entry keeps the data alive, so their ids are not reused while cached
+    key = (id(trainX), id(trainY), id(testX), id(testY))
+    if key not in _resamplers:
+        _resamplers[key] = (
+            StratifiedResampler(trainX, trainY, testX, testY),
+            (trainX, trainY, testX, testY),
+        )
+        while len(_resamplers) > dataset_cache._max_datasets:
+            _resamplers.popitem(last=False)
+    _resamplers.move_to_end(key)
+    return _resamplers[key][0]
 
 
 def run_clustering_experiment(
@@ -179,6 +217,7 @@ def load_and_run_clustering_experiment(
     overwrite=False,
     format=".ts",
     train_file=False,
+    cache_dir=None,
 ):
     """Run a clustering experiment.
 
@@ -211,6 +250,9 @@ def load_and_run_clustering_experiment(
     train_file: boolean, default = False
         whether to generate train files or not. If true, it performs a 10xCV on the
         train and saves
+    cache_dir : str, default = None
+        Directory of the on-disk dataset cache, next to the problem files if None,
+        see load_dataset.
     """
     # Set up the file path in standard format
     if not overwrite:
@@ -243,12 +285,14 @@ def load_and_run_clustering_experiment(
             return
 
     # currently only works with .ts
-    trainX, trainY = load_ts(problem_path + dataset + "/" + dataset + "_TRAIN" + format)
-    testX, testY = load_ts(problem_path + dataset + "/" + dataset + "_TEST" + format)
+    train_file_path = problem_path + dataset + "/" + dataset + "_TRAIN" + format
+    test_file_path = problem_path + dataset + "/" + dataset + "_TEST" + format
+    trainX, trainY = load_dataset(train_file_path, cache_dir)
+    testX, testY = load_dataset(test_file_path, cache_dir)
     if resample_id != 0:
-        trainX, trainY, testX, testY = stratified_resample(
-            trainX, trainY, testX, testY, resample_id
-        )
+        trainX, trainY, testX, testY = _resampler(
+            trainX, trainY, testX, testY
+        ).resample(resample_id)
     le = preprocessing.LabelEncoder()
     le.fit(trainY)
     trainY = le.transform(trainY)
@@ -320,6 +364,10 @@ def run_classification_experiment(
     dataset="",
     resample_id=0,
     train_file=False,
+    trace_memory=False,
+    train_n_jobs=1,
+    threads_per_fold=None,
+    reuse_fold_models=False,
 ):
     """Run a classification experiment and save the results to file.
 
@@ -351,14 +399,38 @@ def run_classification_experiment(
         Whether to generate train files or not. If true, it performs a 10-fold
         cross-validation on the train data and saves. If the classifier can produce its
         own estimates, those are used instead.
+    trace_memory : bool, default=False
+        Whether to trace the memory allocated in each phase with tracemalloc, which
+        slows the experiment down. If False, the peak resident set size of the
+        process during each phase is reported instead, only on Linux.
+    train_n_jobs : int, default=1
+        Number of folds of the 10-fold cross-validation fitted in parallel
+        processes, if the classifier cannot produce its own train estimates.
+    threads_per_fold : int or None, default=None
+        Limit of the BLAS and OpenMP threads of each fold. If None, the CPUs are
+        shared among the parallel folds, and serial folds are not limited.
+    reuse_fold_models : bool, default=False
+        Whether to keep the fitted fold models in
+        <results_path>/<cls_name>/FoldModels/<dataset>/resample<resampleID>/ and
+        reuse them instead of refitting when the train file is built again with the
+        same classifier parameters.
+
+    Notes
+    -----
+    Wall and CPU time, memory and thread counts of fitting, predicting and the
+    train estimates are written to resources<resampleID>.json next to the result
+    files, with the fit and predict_proba resources of every cross-validation fold
+    under "train_folds". The third line of the results files holds the times in
+    milliseconds and the memory in bytes, -1 where it is not available.
     """
-    start = int(round(time.time() * 1000))
-    classifier.fit(trainX, trainY)
-    build_time = int(round(time.time() * 1000)) - start
-    start = int(round(time.time() * 1000))
-    probs = classifier.predict_proba(testX)
-    preds = classifier.classes_[np.argmax(probs, axis=1)]
-    test_time = int(round(time.time() * 1000)) - start
+    resources = {"trace_memory": trace_memory}
+    with measure(trace_memory) as resources["fit"]:
+        classifier.fit(trainX, trainY)
+    with measure(trace_memory) as resources["predict_proba"]:
+        probs = classifier.predict_proba(testX)
+        preds = classifier.classes_[np.argmax(probs, axis=1)]
+    build_time = resources["fit"]["wall_ns"] // 1_000_000
+    test_time = resources["predict_proba"]["wall_ns"] // 1_000_000
     ac = accuracy_score(testY, preds)
     if "Composite" in cls_name:
         second = "Para info too long!"
@@ -372,7 +444,9 @@ def run_classification_experiment(
         + str(build_time)
         + ","
         + str(test_time)
-        + ",-1,-1,"
+        + ",-1,"
+        + str(_memory(resources["fit"]))
+        + ","
         + str(len(classifier.classes_))
     )
     write_results_to_uea_format(
@@ -389,16 +463,31 @@ def run_classification_experiment(
         full_path=False,
     )
     if train_file:
-        start = int(round(time.time() * 1000))
-        if hasattr(
-            classifier, "_get_train_probs"
-        ):  # Normally Can only do this if test has been built
-            train_probs = classifier._get_train_probs(trainX)
-        else:
-            train_probs = cross_val_predict(
-                classifier, X=trainX, y=trainY, cv=10, method="predict_proba"
-            )
-        train_time = int(round(time.time() * 1000)) - start
+        with measure(trace_memory) as resources["train_estimate"]:
+            if hasattr(
+                classifier, "_get_train_probs"
+            ):  # Normally Can only do this if test has been built
+                resources["train_estimate_method"] = "_get_train_probs"
+                train_probs = classifier._get_train_probs(trainX)
+            else:
+                resources["train_estimate_method"] = "cross_val_predict"
+                fold_model_dir = None
+                if reuse_fold_models:
+                    fold_model_dir = (
+                        f"{results_path}/{cls_name}/FoldModels/{dataset}/"
+                        f"resample{resample_id}"
+                    )
+                train_probs, resources["train_folds"] = cross_val_train_probs(
+                    classifier,
+                    trainX,
+                    trainY,
+                    cv=10,
+                    n_jobs=train_n_jobs,
+                    threads_per_fold=threads_per_fold,
+                    fold_model_dir=fold_model_dir,
+                    trace_memory=trace_memory,
+                )
+        train_time = resources["train_estimate"]["wall_ns"] // 1_000_000
         train_preds = classifier.classes_[np.argmax(train_probs, axis=1)]
         train_acc = accuracy_score(trainY, train_preds)
         if "Composite" in cls_name:
@@ -411,7 +500,9 @@ def run_classification_experiment(
             str(train_acc)
             + ","
             + str(train_time)
-            + ",-1,-1,-1,"
+            + ",-1,-1,"
+            + str(_memory(resources["train_estimate"]))
+            + ","
             + str(len(classifier.classes_))
         )
         write_results_to_uea_format(
@@ -427,6 +518,16 @@ def run_classification_experiment(
             split="TRAIN",
             full_path=False,
         )
+    path = f"{results_path}/{cls_name}/Predictions/{dataset}/"
+    os.makedirs(path, exist_ok=True)
+    with open(f"{path}resources{resample_id}.json", "w") as f:
+        json.dump(resources, f, indent=2)
+
+
+def _memory(stats):
+    """Return the memory of a phase for the results file, -1 if unknown."""
+    memory = stats.get("peak_traced_bytes", stats["peak_rss_bytes"])
+    return -1 if memory is None else memory
 
 
 def load_and_run_classification_experiment(
@@ -438,6 +539,10 @@ def load_and_run_classification_experiment(
     resample_id=0,
     overwrite=False,
     build_train=False,
+    train_n_jobs=1,
+    threads_per_fold=None,
+    reuse_fold_models=False,
+    cache_dir=None,
 ):
     """Load a dataset and run a classification experiment.
 
@@ -470,57 +575,53 @@ def load_and_run_classification_experiment(
         Whether to generate train files or not. If true, it performs a 10-fold
         cross-validation on the train data and saves. If the classifier can produce its
         own estimates, those are used instead.
+    train_n_jobs : int, default=1
+        Number of folds of the train cross-validation fitted in parallel.
+    threads_per_fold : int or None, default=None
+        Limit of the BLAS and OpenMP threads of each fold, see
+        run_classification_experiment.
+    reuse_fold_models : bool, default=False
+        Whether to keep the fold models and reuse them when the train file is built
+        again, see run_classification_experiment.
+    cache_dir : str, default=None
+        Directory of the on-disk dataset cache, next to the problem files if None,
+        see load_dataset.
     """
     # Check which files exist, if both exist, exit
     build_test = True
     if not overwrite:
-        full_path = (
-            str(results_path)
-            + "/"
-            + str(cls_name)
-            + "/Predictions/"
-            + str(dataset)
-            + "/testResample"
-            + str(resample_id)
-            + ".csv"
+        build_test, build_train = _missing_results(
+            results_path, cls_name, dataset, resample_id, build_train
         )
-        if os.path.exists(full_path):
-            build_test = False
-        if build_train:
-            full_path = (
-                str(results_path)
-                + "/"
-                + str(cls_name)
-                + "/Predictions/"
-                + str(dataset)
-                + "/trainResample"
-                + str(resample_id)
-                + ".csv"
-            )
-            if os.path.exists(full_path):
-                build_train = False
         if build_train is False and build_test is False:
             return
 
-    trainX, trainY = load_ts(problem_path + dataset + "/" + dataset + "_TRAIN.ts")
-    testX, testY = load_ts(problem_path + dataset + "/" + dataset + "_TEST.ts")
+    trainX, trainY = load_dataset(
+        problem_path + dataset + "/" + dataset + "_TRAIN.ts", cache_dir
+    )
+    testX, testY = load_dataset(
+        problem_path + dataset + "/" + dataset + "_TEST.ts", cache_dir
+    )
     if resample_id != 0:
-        trainX, trainY, testX, testY = stratified_resample(
-            trainX, trainY, testX, testY, resample_id
-        )
+        trainX, trainY, testX, testY = _resampler(
+            trainX, trainY, testX, testY
+        ).resample(resample_id)
     if classifier is None:
         classifier = set_classifier(cls_name, resample_id)
     run_classification_experiment(
         trainX,
-        classifier,
-        results_path,
         trainY,
         testX,
         testY,
+        classifier,
+        results_path,
         cls_name=cls_name,
         dataset=dataset,
         resample_id=resample_id,
         train_file=build_train,
+        train_n_jobs=train_n_jobs,
+        threads_per_fold=threads_per_fold,
+        reuse_fold_models=reuse_fold_models,
     )
 
 
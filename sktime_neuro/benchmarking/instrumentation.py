@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Measure time, memory and threads of the phases of an experiment."""
+__all__ = ["measure"]
+
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from threadpoolctl import threadpool_info
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+@contextmanager
+def measure(trace_memory=False):
+    """Measure the code run in the with block.
+
+    Yields a dict that is filled when the block is left with
+
+    - wall_ns: elapsed wall time, from ``time.perf_counter_ns``
+    - cpu_ns: CPU time of all threads of this process, from
+      ``time.process_time_ns``, can be larger than wall_ns for parallel code
+    - peak_rss_bytes: peak resident set size of this process during the block,
+      only on Linux, None elsewhere. The peak is reset when the block is
+      entered, by writing to /proc/self/clear_refs, and read from VmHWM.
+      Blocks may be nested, but must not run in parallel threads.
+    - process_peak_rss_bytes: peak resident set size of this process since it
+      started, from ``resource.getrusage``, None where the resource module is
+      not available
+    - peak_traced_bytes: peak memory allocated by Python during the block, from
+      ``tracemalloc``, only if trace_memory is True
+    - n_threads: number of Python threads at the end of the block
+    - n_blas_threads: largest number of threads of the BLAS and OpenMP
+      libraries, from ``threadpoolctl``
+
+    The memory of child processes, e.g. of parallel jobs, is not included.
+
+    Parameters
+    ----------
+    trace_memory : bool, default=False
+        Trace the memory allocations of the block, which slows it down.
+    """
+    stats = {}
+    started_tracing = False
+    if trace_memory:
+        if tracemalloc.is_tracing():
+            # only counts the peak of this block from python 3.9 on
+            getattr(tracemalloc, "reset_peak", lambda: None)()
+        else:
+            tracemalloc.start()
+            started_tracing = True
+    reset = _reset_peak_rss()
+    wall = time.perf_counter_ns()
+    cpu = time.process_time_ns()
+    try:
+        yield stats
+    finally:
+        stats["wall_ns"] = time.perf_counter_ns() - wall
+        stats["cpu_ns"] = time.process_time_ns() - cpu
+        stats["peak_rss_bytes"] = _block_peak_rss() if reset else None
+        stats["process_peak_rss_bytes"] = _peak_rss()
+        if trace_memory:
+            stats["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+        stats["n_threads"] = threading.active_count()
+        stats["n_blas_threads"] = max(
+            [info["num_threads"] for info in threadpool_info()], default=0
+        )
+
+
+# peaks of the enclosing blocks seen before nested blocks reset them, innermost last
+_block_peaks = []
+# highest peak seen before a reset, which also resets ru_maxrss on Linux
+_process_peak = 0
+
+
+def _reset_peak_rss():
+    """Reset the peak resident set size of this process, return if it worked."""
+    global _process_peak
+    try:
+        peak = _vm_hwm()
+        _process_peak = max(_process_peak, peak)
+        if _block_peaks:
+            _block_peaks[-1] = max(_block_peaks[-1], peak)
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except (OSError, ValueError):
+        # not Linux, or not allowed
+        return False
+    _block_peaks.append(0)
+    return True
+
+
+def _block_peak_rss():
+    """Return the peak resident set size since the last reset in bytes."""
+    peak = max(_vm_hwm(), _block_peaks.pop())
+    if _block_peaks:
+        _block_peaks[-1] = max(_block_peaks[-1], peak)
+    return peak
+
+
+def _vm_hwm():
+    """Return the peak resident set size from /proc/self/status in bytes."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    raise ValueError("VmHWM not found")
+
+
+def _peak_rss():
+    """Return the peak resident set size of this process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    return max(peak, _process_peak)
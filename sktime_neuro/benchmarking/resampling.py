@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Stratified resampling of train and test data by index."""
+__all__ = ["StratifiedResampler", "stratified_resample"]
+
+import numpy as np
+import pandas as pd
+from sklearn.utils import check_random_state
+
+
+class StratifiedResampler:
+    """Resample train and test data with the class distribution of the train data.
+
+    Gives the same resamples as ``sktime.utils.sampling.stratified_resample`` for
+    the same random state, but the indices of every class are found once, and
+    each resample only shuffles them and gathers the cases from the combined data
+    instead of concatenating DataFrames class by class.
+
+    Parameters
+    ----------
+    X_train : pd.DataFrame or np.array
+        train data, nested DataFrame or array of shape cases*channels*timepoints
+    y_train : np.array
+        train data class labels
+    X_test : pd.DataFrame or np.array
+        test data in the same format as X_train
+    y_test : np.array
+        test data class labels
+    """
+
+    def __init__(self, X_train, y_train, X_test, y_test):
+        if isinstance(X_train, pd.DataFrame):
+            self.X = pd.concat([X_train, X_test])
+        else:
+            self.X = np.concatenate([X_train, X_test])
+        self.y = np.concatenate((y_train, y_test), axis=None)
+        classes, counts = np.unique(y_train, return_counts=True)
+        if list(classes) != list(np.unique(y_test)):
+            raise ValueError("Train and test data need to contain the same classes")
+        self.n_train = counts
+        self.class_indices = [np.where(self.y == label)[0] for label in classes]
+
+    def split(self, random_state):
+        """Return the train and test indices into the combined data for a seed.
+
+        Parameters
+        ----------
+        random_state : int
+            seed of the resample
+
+        Returns
+        -------
+        train_indices : np.array
+        test_indices : np.array
+        """
+        random_state = check_random_state(random_state)
+        train, test = [], []
+        for indices, n_train in zip(self.class_indices, self.n_train):
+            # shuffle a copy in the same order as stratified_resample does
+            indices = indices.copy()
+            random_state.shuffle(indices)
+            train.append(indices[:n_train])
+            test.append(indices[n_train:])
+        return np.concatenate(train), np.concatenate(test)
+
+    def resample(self, random_state):
+        """Return new train and test data for a seed.
+
+        Parameters
+        ----------
+        random_state : int
+            seed of the resample
+
+        Returns
+        -------
+        X_train, y_train, X_test, y_test
+        """
+        train, test = self.split(random_state)
+        return self._take(train), self.y[train], self._take(test), self.y[test]
+
+    def _take(self, indices):
+        if isinstance(self.X, pd.DataFrame):
+            return self.X.iloc[indices].reset_index(drop=True)
+        return self.X[indices]
+
+
+def stratified_resample(X_train, y_train, X_test, y_test, random_state):
+    """Stratified resample data without replacement using a random state.
+
+    Drop-in for ``sktime.utils.sampling.stratified_resample`` that also accepts
+    numpy panels, see StratifiedResampler.
+    """
+    resampler = StratifiedResampler(X_train, y_train, X_test, y_test)
+    return resampler.resample(random_state)
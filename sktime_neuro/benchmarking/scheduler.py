@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Run a grid of classification experiments on a local process pool."""
+__all__ = ["run_classification_experiments"]
+
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+
+def run_classification_experiments(
+    problem_path,
+    results_path,
+    classifiers,
+    datasets,
+    resample_ids=range(30),
+    n_jobs=1,
+    threads_per_job=1,
+    pin_cpus=False,
+    overwrite=False,
+    build_train=False,
+    cache_dir=None,
+    verbose=True,
+):
+    """Run the classification experiments of a grid on a local process pool.
+
+    Every combination of classifier, dataset and resample id is one job that is
+    run like load_and_run_classification_experiment. Jobs whose result files
+    already exist are skipped unless overwrite is True. At most n_jobs jobs run at
+    the same time, each limited to threads_per_job threads. A summary of all jobs
+    is written to <results_path>/manifest.csv.
+
+    If a worker process dies, e.g. killed for running out of memory, the pool
+    cannot run any more jobs. The job it ran and all jobs that did not finish yet
+    are then recorded as failed, and are run again by the next call.
+
+    Parameters
+    ----------
+    problem_path : str
+        Location of problem files, full path.
+    results_path : str
+        Location of where to write results. Any required directories will be created.
+    classifiers : list of str
+        Names of the classifiers, as defined in set_classifier.
+    datasets : list of str
+        Names of the problems, e.g. eeg_problems.
+    resample_ids : iterable of int, default=range(30)
+        Seeds for resampling, 0 is the default train/test split.
+    n_jobs : int, default=1
+        Number of jobs to run at the same time. Negative values count from the
+        number of CPUs like in joblib, -1 uses all of them, -2 all but one, and
+        so on, divided by threads_per_job.
+    threads_per_job : int, default=1
+        Number of threads numpy and the BLAS/OpenMP libraries may use in each job.
+    pin_cpus : bool, default=False
+        Pin each worker process to its own threads_per_job CPUs, only on Linux,
+        raises a ValueError where CPU affinity is not supported.
+    overwrite : bool, default=False
+        If True, jobs are run even if their result files exist.
+    build_train : bool, default=False
+        Whether to generate train files or not, see
+        load_and_run_classification_experiment.
+    cache_dir : str, default=None
+        Directory of the on-disk dataset cache, next to the problem files if None,
+        shared by all jobs.
+    verbose : bool, default=True
+        Print the progress.
+
+    Returns
+    -------
+    manifest : pd.DataFrame
+        One row per job with classifier, dataset, resample_id, status ("done",
+        "skipped" or "failed"), seconds and error.
+    """
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() + 1 + n_jobs) // threads_per_job, 1)
+    if pin_cpus and not hasattr(os, "sched_getaffinity"):
+        raise ValueError("pin_cpus is only supported on Linux")
+    jobs = []
+    manifest = []
+    for cls_name, dataset, resample_id in itertools.product(
+        classifiers, datasets, resample_ids
+    ):
+        job = {"classifier": cls_name, "dataset": dataset, "resample_id": resample_id}
+        build_test, build = _missing_results(
+            results_path, cls_name, dataset, resample_id, build_train
+        )
+        if overwrite or build_test or build:
+            jobs.append(job)
+        else:
+            manifest.append({**job, "status": "skipped", "seconds": 0.0, "error": ""})
+
+    cpu_sets = None
+    if pin_cpus:
+        # every worker takes its CPUs from the queue when it starts
+        cpu_sets = multiprocessing.Queue()
+        cpus = sorted(os.sched_getaffinity(0))
+        for i in range(n_jobs):
+            cpu_set = cpus[i * threads_per_job : (i + 1) * threads_per_job]
+            cpu_sets.put(cpu_set or cpus)
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_worker,
+        initargs=(threads_per_job, cpu_sets),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _run_job,
+                problem_path,
+                results_path,
+                overwrite,
+                build_train,
+                cache_dir,
+                **job,
+            ): job
+            for job in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            try:
+                seconds, error = future.result()
+            except Exception as e:
+                # the worker died, e.g. BrokenProcessPool after a segfault
+                seconds, error = 0.0, repr(e)
+            status = "failed" if error else "done"
+            manifest.append(
+                {**job, "status": status, "seconds": seconds, "error": error}
+            )
+            if verbose:
+                print(
+                    f"[{done}/{len(jobs)}] {job['classifier']} {job['dataset']} "
+                    f"{job['resample_id']}: {status} in {seconds:.1f}s"
+                )
+
+    manifest = pd.DataFrame(
+        manifest,
+        columns=["classifier", "dataset", "resample_id", "status", "seconds", "error"],
+    ).sort_values(["classifier", "dataset", "resample_id"], ignore_index=True)
+    os.makedirs(results_path, exist_ok=True)
+    manifest.to_csv(os.path.join(results_path, "manifest.csv"), index=False)
+    return manifest
+
+
+def _missing_results(results_path, cls_name, dataset, resample_id, build_train):
+    """Check which of the test and train result files still need to be built."""
+    path = f"{results_path}/{cls_name}/Predictions/{dataset}/"
+    build_test = not os.path.exists(f"{path}testResample{resample_id}.csv")
+    if build_train:
+        build_train = not os.path.exists(f"{path}trainResample{resample_id}.csv")
+    return build_test, build_train
+
+
+def _init_worker(threads_per_job, cpu_sets):
+    """Limit the threads of a worker process and pin it to its CPUs."""
+    # environment variables only reach libraries that are loaded later,
+    # threadpoolctl limits the ones already loaded
+    for var in ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"]:
+        os.environ[var] = str(threads_per_job)
+    threadpool_limits(limits=threads_per_job)
+    if cpu_sets is not None:
+        os.sched_setaffinity(0, cpu_sets.get())
+
+
+def _run_job(problem_path, results_path, overwrite, build_train, cache_dir, **job):
+    """Run one experiment, return the seconds it took and the error, if any."""
+    # imported here, as the experiments import the scheduler
+    from sktime_neuro.benchmarking import experiments
+
+    start = time.perf_counter()
+    try:
+        experiments.load_and_run_classification_experiment(
+            problem_path,
+            results_path,
+            cls_name=job["classifier"],
+            dataset=job["dataset"],
+            resample_id=job["resample_id"],
+            overwrite=overwrite,
+            build_train=build_train,
+            cache_dir=cache_dir,
+        )
+    except Exception as e:
+        return time.perf_counter() - start, repr(e)
+    return time.perf_counter() - start, ""
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 import scipy.io
 import mne
-from sktime_neuro.utils import mne_processing as utils
+from sktime_neuro.utils.dataset_cache import load_cached
+from sktime_neuro.utils.event_table import EventTable
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
 
 
-def load_c4_ds1(path, subject, load="train"):
+def load_c4_ds1(
+    path, subject, load="train", as_event_table=False, cache=False, cache_dir=None
+):
     """Load Data from the first dataset of the 4th BCI competition.
 
     Data to be found at: http://www.bbci.de/competition/iv/#datasets
@@ -20,6 +24,13 @@ def load_c4_ds1(path, subject, load="train"):
         number of subject to load
     load : str (either "train" or "test")
         laod train or test data
+    as_event_table : bool (default False)
+        return the events as EventTable instead of pd.DataFrame
+    cache : bool (default False)
+        keep the parsed file as .npy files and load them memory mapped
+        the next time, until the file is modified
+    cache_dir : str or None (default None)
+        directory of the cache, next to the file if None
 
     Returns
     -------
@@ -28,7 +39,7 @@ def load_c4_ds1(path, subject, load="train"):
         sampling frequency od the recorded data
     data : np.array
         recorded data with shape timepoints*channels
-    annotation : pd.Dataframe
+    annotation : pd.Dataframe or EventTable
          one row per event with columns
         "onset", "duration" and "description"
     """
@@ -52,18 +63,20 @@ def load_c4_ds1(path, subject, load="train"):
     else:
         raise ValueError("can only load test or train")
 
-    m = scipy.io.loadmat(fname, struct_as_record=True)
-
-    # get raw data
-    data = m["cnt"].astype(float)
-
-    # get sampling frequency
-    fs = int(m["nfo"]["fs"][0][0][0][0])
+    if cache:
+        m = load_cached(fname, _read_c4_ds1, "c4_ds1", cache_dir)
+    else:
+        m = _read_c4_ds1(fname)
+    data = m["data"]
+    fs = int(m["fs"])
 
     # create annotation
+    event_description = m["description"]
+    if as_event_table:
+        events = EventTable.from_descriptions(m["onset"], event_description, fs)
+        return fs, data, events
     # multiplying by fs to get onset time and not index
-    event_onsets = m["mrk"][0][0][0][0] * (1 / fs)
-    event_description = m["mrk"][0][0][1][0]
+    event_onsets = m["onset"] * (1 / fs)
     annotation_pandas = pd.DataFrame(columns=["onset", "duration", "description"])
     annotation_pandas["onset"] = event_onsets
     annotation_pandas["description"] = event_description
@@ -73,11 +86,39 @@ def load_c4_ds1(path, subject, load="train"):
     return fs, data, annotation_pandas
 
 
-def load_c4_ds2b(path, subject, load="train"):
+def _read_c4_ds1(fname):
+    """Read data, sampling frequency and markers of a c4_ds1 file."""
+    m = scipy.io.loadmat(
+        fname, struct_as_record=True, variable_names=["cnt", "mrk", "nfo"]
+    )
+    return {
+        # get raw data
+        "data": m["cnt"].astype(float),
+        # get sampling frequency
+        "fs": np.asarray(int(m["nfo"]["fs"][0][0][0][0])),
+        # onsets of the events as indices
+        "onset": m["mrk"][0][0][0][0],
+        "description": m["mrk"][0][0][1][0],
+    }
+
+
+def load_c4_ds2b(
+    path,
+    subject,
+    load="train",
+    as_event_table=False,
+    n_jobs=1,
+    cache=False,
+    cache_dir=None,
+):
     """Load Data from the first dataset of the 4th BCI competition.
 
     Data to be found at: http://www.bbci.de/competition/iv/#datasets
 
+    The sessions are read in parallel and copied into one preallocated
+    array of shape timepoints*channels, with boundary annotations between
+    sessions like ``mne.io.Raw.append`` adds them.
+
     Parameters
     ----------
 
@@ -87,6 +128,15 @@ def load_c4_ds2b(path, subject, load="train"):
         number of subject to load
     load : str (either "train" or "test")
         laod train or test data
+    as_event_table : bool (default False)
+        return the events as EventTable instead of pd.DataFrame
+    n_jobs : int (default 1)
+        number of sessions read at the same time
+    cache : bool (default False)
+        keep the concatenated sessions as .npy files and load them memory
+        mapped the next time, until one of the files is modified
+    cache_dir : str or None (default None)
+        directory of the cache, next to the files if None
 
     Returns
     -------
@@ -95,46 +145,89 @@ def load_c4_ds2b(path, subject, load="train"):
         sampling frequency od the recorded data
     data : np.array
         recorded data with shape timepoints*channels
-    annotation : pd.Dataframe
+    annotation : pd.Dataframe or EventTable
          one row per event with columns
         "onset", "duration" and "description"
     """
 
+    # 1 to 3 is training and 4 & 5 is testing
     if load == "train":
-        for i in range(1, 4):
-            # 1 to 3 is training and 4 & 5 is testing
-            # first load data into mne format
-            fname = path + "B" + subject + "0" + str(i) + "T.gdf"
-            if i == 1:
-                raw = mne.io.read_raw_gdf(fname, preload=True)
-            elif 1 < i < 4:
-                raw_new = mne.io.read_raw_gdf(fname, preload=True)
-                raw.append(raw_new)
-
+        fnames = [path + "B" + subject + "0" + str(i) + "T.gdf" for i in range(1, 4)]
     elif load == "test":
-        # 1 to 3 is training and 4 & 5 is testing
-        # first load data into mne format
-        for i in range(4, 6):
-            fname = path + "B" + subject + "0" + str(i) + "E.gdf"
-            if i == 4:
-                raw = mne.io.read_raw_gdf(fname)
-            elif i == 5:
-                raw_new = mne.io.read_raw_gdf(fname)
-                raw.append(raw_new)
-
-    # create data and annotation from mne object
-    annotation = utils.create_annotation(raw)
+        fnames = [path + "B" + subject + "0" + str(i) + "E.gdf" for i in range(4, 6)]
+    else:
+        raise ValueError("can only load test or train")
 
-    # get numpy array from mne data, only include eeg channels
-    # and transpose to achieve shape timepoints*channels
-    data = raw.pick_types(eeg=True).get_data().transpose()
+    def read(fnames):
+        return _read_c4_ds2b(fnames, n_jobs)
 
-    fs = raw.info["sfreq"]
+    if cache:
+        m = load_cached(fnames, read, "c4_ds2b", cache_dir)
+    else:
+        m = read(fnames)
+    fs = float(m["fs"])
+    data = m["data"]
+
+    if as_event_table:
+        # same truncation as EventTable.from_mne
+        onset = (fs * m["onset"]).astype(np.int64)
+        annotation = EventTable.from_descriptions(
+            onset, m["description"], fs, m["duration"]
+        )
+    else:
+        annotation = pd.DataFrame(
+            {
+                "onset": m["onset"],
+                "duration": m["duration"],
+                "description": pd.Categorical(m["description"]),
+            }
+        )
 
     return fs, data, annotation
 
 
-def load_BNCI_2(path, subject, load="train"):
+def _read_c4_ds2b(fnames, n_jobs):
+    """Read and concatenate the eeg channels and annotations of sessions."""
+    sessions = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_read_gdf_session)(fname) for fname in fnames
+    )
+    fs = sessions[0][0]
+    lengths = [session[1].shape[1] for session in sessions]
+    data = np.empty((sum(lengths), sessions[0][1].shape[0]))
+    onsets, durations, descriptions = [], [], []
+    start = 0
+    for (_, session, annotations), length in zip(sessions, lengths):
+        # one copy per session from channels*timepoints to timepoints*channels
+        data[start : start + length] = session.T
+        if start > 0:
+            onsets.append(np.full(2, start / fs))
+            durations.append(np.zeros(2))
+            descriptions.append(np.array(["BAD boundary", "EDGE boundary"]))
+        onsets.append(annotations.onset + start / fs)
+        durations.append(annotations.duration)
+        descriptions.append(annotations.description)
+        start += length
+    onsets = np.concatenate(onsets)
+    order = np.argsort(onsets, kind="stable")
+    return {
+        "fs": np.asarray(fs),
+        "data": data,
+        "onset": onsets[order],
+        "duration": np.concatenate(durations)[order],
+        "description": np.concatenate(descriptions)[order].astype(str),
+    }
+
+
+def _read_gdf_session(fname):
+    """Read sampling frequency, eeg channels and annotations of a gdf file."""
+    raw = mne.io.read_raw_gdf(fname, preload=True)
+    raw.pick_types(eeg=True)
+    return raw.info["sfreq"], raw.get_data(), raw.annotations
+
+
+def load_BNCI_2(
+    path, subject, load="train", as_event_table=False, cache=False, cache_dir=None
+):
     """Load Data from the second dataset of BNCI Horizon 2020.
 
     Data to be found at: http://bnci-horizon-2020.eu/database/data-sets
@@ -148,6 +241,13 @@ def load_BNCI_2(path, subject, load="train"):
         number of subject to load
     load : str (either "train" or "test")
         laod train or test data
+    as_event_table : bool (default False)
+        return the events as EventTable instead of pd.DataFrame
+    cache : bool (default False)
+        keep the parsed file as .npy files and load them memory mapped
+        the next time, until the file is modified
+    cache_dir : str or None (default None)
+        directory of the cache, next to the file if None
 
     Returns
     -------
@@ -156,7 +256,7 @@ def load_BNCI_2(path, subject, load="train"):
         sampling frequency od the recorded data
     data : np.array
         recorded data with shape timepoints*channels
-    annotation : pd.Dataframe
+    annotation : pd.Dataframe or EventTable
          one row per event with columns
         "onset", "duration" and "description"
     """
@@ -169,34 +269,45 @@ def load_BNCI_2(path, subject, load="train"):
     else:
         raise ValueError("can only load test or train")
 
-    m = scipy.io.loadmat(fname, struct_as_record=True)
+    if cache:
+        m = load_cached(fname, lambda f: _read_BNCI_2(f, runs), "BNCI_2", cache_dir)
+    else:
+        m = _read_BNCI_2(fname, runs)
     annotation_pandas = pd.DataFrame(columns=["onset", "duration", "description"])
 
     fs = 512
-    len_of_last_run = 0
-    for run in range(runs):
-        if run == 0:
-            data = m["data"][0][run][0][0][0]
-            onsets = ((m["data"][0][run][0][0][1] + len_of_last_run) * 1 / fs).flatten()
-            labels = (m["data"][0][run][0][0][2]).flatten()
-            len_of_last_run = data.shape[0]
-        else:
-            new_data = m["data"][0][run][0][0][0]
-            data = np.vstack((data, new_data))
-            new_onsets = (
-                (m["data"][0][run][0][0][1] + len_of_last_run) * 1 / fs
-            ).flatten()
-            onsets = np.concatenate((onsets, new_onsets))
-            new_labels = (m["data"][0][run][0][0][2]).flatten()
-            labels = np.concatenate((labels, new_labels))
-            len_of_last_run = data.shape[0]
-
-    annotation_pandas["onset"] = onsets
+    data, labels = m["data"], m["description"]
+    if as_event_table:
+        return fs, data, EventTable.from_descriptions(m["onset"], labels, fs)
+    annotation_pandas["onset"] = m["onset"] * 1 / fs
     annotation_pandas["description"] = labels
 
     return fs, data, annotation_pandas
 
 
+def _read_BNCI_2(fname, n_runs):
+    """Read the runs of a BNCI_2 file into one array, onsets as indices."""
+    m = scipy.io.loadmat(fname, struct_as_record=True, variable_names=["data"])
+    runs = [m["data"][0][run][0][0] for run in range(n_runs)]
+    lengths = [run[0].shape[0] for run in runs]
+    # fill one preallocated array instead of stacking run after run
+    data = np.empty(
+        (sum(lengths), runs[0][0].shape[1]), np.result_type(*[run[0] for run in runs])
+    )
+    onsets = []
+    start = 0
+    for run, length in zip(runs, lengths):
+        data[start : start + length] = run[0]
+        # onsets of each run count from the start of the run
+        onsets.append(run[1].flatten() + start)
+        start += length
+    return {
+        "data": data,
+        "onset": np.concatenate(onsets),
+        "description": np.concatenate([run[2].flatten() for run in runs]),
+    }
+
+
 if __name__ == "__main__":
     competition = "c4_ds1"
 
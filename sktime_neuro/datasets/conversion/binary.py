@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Binary dataset format as a fast alternative to .ts text files.
+
+A dataset is a directory path/problem_name/problem_name{fold}/ holding
+
+- header.json: problem name, number of cases and dimensions, lengths and dtype
+- values.npy: all values of all series, concatenated case by case and
+  dimension by dimension
+- offsets.npy: int64 array of n_cases * n_dimensions + 1 positions in
+  values, series j of case i is values[offsets[i * d + j]:offsets[i * d + j + 1]]
+- labels.npy: class value of each case, only if class values are given
+
+The values are loaded memory mapped, so loading only reads the header and
+the offsets, and every series is a view into the file.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from sktime.datasets import load_from_tsfile_to_dataframe
+
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+
+FORMAT_VERSION = 1
+
+
+def write_jagged_to_npy_dataset(
+    data, path, problem_name="sample_data", class_value_list=None, fold="", dtype=None
+):
+    """
+    Write a dataset in jagged list format to the binary format.
+
+    Parameters
+    ----------
+    data: Jagged 3d List
+        list of cases, each a list of one series per dimension,
+        like for ``write_jaggeddf_to_tsfile``
+    path: str
+        directory to write the dataset to
+    problem_name: str, default="sample_data"
+        name of the dataset
+    class_value_list: pd.series, ndarray or None, default=None
+        The class values for each case, optional.
+    fold: str, default=""
+        Addon at the end of the directory name, i.e. _TRAIN or _TEST.
+    dtype: np.dtype or None, default=None
+        type to store the values as, the common type of all series if None
+
+    Returns
+    -------
+    dirt : str
+        directory of the dataset
+    """
+    n_dimensions = len(data[0]) if len(data) > 0 else 0
+    if any(len(case) != n_dimensions for case in data):
+        raise ValueError("All cases need to have the same number of dimensions")
+    if class_value_list is not None and len(class_value_list) != len(data):
+        raise IndexError(
+            "The number of cases is not the same as the number of given class values"
+        )
+    series = [np.asarray(dimension) for case in data for dimension in case]
+    lengths = np.array([len(s) for s in series], dtype=np.int64)
+    offsets = np.zeros(len(series) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if dtype is None:
+        dtype = np.result_type(*series) if series else np.float64
+
+    dirt = os.path.join(str(path), str(problem_name), f"{problem_name}{fold or ''}")
+    os.makedirs(dirt, exist_ok=True)
+    # write the values series by series, without concatenating them in memory
+    values = np.lib.format.open_memmap(
+        os.path.join(dirt, "values.npy"), mode="w+", dtype=dtype, shape=(offsets[-1],)
+    )
+    for s, start, stop in zip(series, offsets[:-1], offsets[1:]):
+        values[start:stop] = s
+    values.flush()
+    del values
+    np.save(os.path.join(dirt, "offsets.npy"), offsets)
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "problem_name": str(problem_name),
+        "n_cases": len(data),
+        "n_dimensions": n_dimensions,
+        "equal_length": bool(len(lengths) > 0 and np.all(lengths == lengths[0])),
+        "series_length": int(lengths[0]) if len(lengths) > 0 else 0,
+        "dtype": np.dtype(dtype).str,
+        "class_labels": None,
+    }
+    if class_value_list is not None:
+        labels = np.asarray(class_value_list)
+        if labels.dtype == object:
+            labels = labels.astype(str)
+        np.save(os.path.join(dirt, "labels.npy"), labels)
+        header["class_labels"] = [str(label) for label in np.unique(labels)]
+    with open(os.path.join(dirt, "header.json"), "w") as f:
+        json.dump(header, f, indent=2)
+    return dirt
+
+
+def load_npy_dataset(
+    path, problem_name, fold="", return_type="jagged", mmap=True, mmap_mode="r"
+):
+    """
+    Load a dataset in the binary format.
+
+    Parameters
+    ----------
+    path: str
+        directory the dataset was written to
+    problem_name: str
+        name of the dataset
+    fold: str, default=""
+        Addon at the end of the directory name, i.e. _TRAIN or _TEST.
+    return_type: str, "jagged", "nested_univ" or "numpy3D", default="jagged"
+        "jagged" returns a list of cases, each a list of series,
+        "nested_univ" a DataFrame with one pd.Series per cell like
+        ``load_from_tsfile_to_dataframe``, "numpy3D" an array of shape
+        cases*dimensions*timepoints, only for series of equal length
+    mmap: bool, default=True
+        map the values into memory instead of reading them
+    mmap_mode: str, default="r"
+        mode of the memory map, with "c" the values can be changed without
+        writing the changes back to the file
+
+    Returns
+    -------
+    X : list, pd.DataFrame or np.ndarray
+        series of the dataset, views into the values
+    y : np.ndarray or None
+        class values, None if the dataset has none
+    """
+    dirt = os.path.join(str(path), str(problem_name), f"{problem_name}{fold or ''}")
+    with open(os.path.join(dirt, "header.json")) as f:
+        header = json.load(f)
+    if header["format_version"] > FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {header['format_version']}")
+    values = np.load(
+        os.path.join(dirt, "values.npy"), mmap_mode=mmap_mode if mmap else None
+    )
+    offsets = np.load(os.path.join(dirt, "offsets.npy"))
+    y = None
+    if header["class_labels"] is not None:
+        y = np.load(os.path.join(dirt, "labels.npy"))
+
+    n_cases, n_dimensions = header["n_cases"], header["n_dimensions"]
+    if return_type == "numpy3D":
+        if not header["equal_length"]:
+            raise ValueError("numpy3D requires series of equal length")
+        return values.reshape(n_cases, n_dimensions, header["series_length"]), y
+    series = [values[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+    cases = [series[i * n_dimensions : (i + 1) * n_dimensions] for i in range(n_cases)]
+    if return_type == "jagged":
+        return cases, y
+    if return_type == "nested_univ":
+        X = pd.DataFrame(
+            [[pd.Series(s, copy=False) for s in case] for case in cases],
+            columns=[f"dim_{j}" for j in range(n_dimensions)],
+        )
+        return X, y
+    raise ValueError("return_type must be 'jagged', 'nested_univ' or 'numpy3D'")
+
+
+def ts_to_npy_dataset(ts_file, path, problem_name, fold=""):
+    """Convert a .ts file to the binary format, returns the dataset directory."""
+    X, y = load_from_tsfile_to_dataframe(ts_file)
+    data = [[np.asarray(s) for s in row] for row in X.itertuples(index=False)]
+    return write_jagged_to_npy_dataset(data, path, problem_name, y, fold)
+
+
+def npy_dataset_to_ts(path, problem_name, ts_path, fold="", precision=None):
+    """Write a dataset in the binary format to a .ts file."""
+    data, y = load_npy_dataset(path, problem_name, fold)
+    write_jaggeddf_to_tsfile(
+        data,
+        ts_path,
+        problem_name=problem_name,
+        class_value_list=y,
+        fold=fold,
+        precision=precision,
+    )
@@ -5,16 +5,75 @@ Both of these formats are 16-bit.
 # See https://github.com/holgern/pyedflib and
 # https://mne.tools/stable/auto_tutorials/io/20_reading_eeg_data.html
 
+import pyedflib
 from pyedflib import highlevel
 import numpy as np
 import pandas as pd
 from sktime.datasets._data_io import *
 
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+
 
 def read_edf(filepath : str) -> np.ndarray:
     return highlevel.read_edf(filepath)
 
 
+def read_edf_annotations(filepath: str) -> list:
+    """
+    Read only the annotations of an EDF+ file, without any signal.
+
+    Returns a list of (onset, duration, description) with onset and
+    duration in seconds, like ``header["annotations"]`` of ``read_edf``.
+    """
+    with pyedflib.EdfReader(filepath) as f:
+        onsets, durations, descriptions = f.readAnnotations()
+    return list(zip(onsets, durations, descriptions))
+
+
+def iter_edf_observations(filepath: str, annotations: list, channels=None):
+    """
+    Lazily read the observations of an EDF file that annotations cover.
+
+    The file is opened once and for every annotation only its sample range
+    is read from each channel, so at most one observation is held in
+    memory at a time.
+
+    Parameters
+    ----------
+    filepath : str
+        path to the EDF file holding the signals
+    annotations : list of (onset, duration, description)
+        onset and duration in seconds, e.g. from ``read_edf_annotations``
+    channels : list of int or str, or None (default None)
+        channels to read by index or label, all channels if None
+
+    Yields
+    ------
+    observation : list of np.ndarray
+        the samples of each channel within the annotation
+    description : str
+        description of the annotation
+    """
+    with pyedflib.EdfReader(filepath) as f:
+        labels = f.getSignalLabels()
+        if channels is None:
+            channels = range(len(labels))
+        channels = [labels.index(ch) if isinstance(ch, str) else ch for ch in channels]
+        n_samples = f.getNSamples()
+        # channels can have different sampling frequencies
+        sfreqs = [f.getSampleFrequency(ch) for ch in channels]
+        for onset, duration, description in annotations:
+            observation = []
+            for ch, sfreq in zip(channels, sfreqs):
+                start = int(onset * sfreq)
+                n = min(int(duration * sfreq), n_samples[ch] - start)
+                if n <= 0:
+                    observation.append(np.empty(0))
+                else:
+                    observation.append(f.readSignal(ch, start=start, n=n))
+            yield observation, description
+
+
 def extract_labels(sighead):
     labels = []
     for head in sighead:
@@ -65,22 +124,22 @@ def handle_multipart(signalFile, annotationFile, outputPath, problemName, isUniV
     to handle this case sepperatley.
     In regard to data that is publically available, this appears to be the
     most common format for data.
+    The signals are read lazily, one annotated observation at a time, and
+    every observation is written to the .ts file before the next one is
+    read, so the whole recording is never held in memory.
     """
-    (dataSignals, dataMetadata, dataHeader) = read_edf(signalFile)
-
-    # Extract each channel into a sepperate list.
-    channels = extract_channels(dataSignals)
-    channelNames = extract_labels(dataMetadata)
-
-    (annotationSignals, annotationMetadata, annotationHeader) = read_edf(annotationFile)
-    observationsPerChannel = []
-    for channel in channels:
-        ob = split_channel_to_induvidual_observations(channel, annotationHeader)
-        observationsPerChannel.append(ob)
-    ops = np.transpose(observationsPerChannel)
-    df = pd.DataFrame(ops, columns=channelNames)
-    annotationVec = extract_annotations(annotationHeader)
-    write_dataframe_to_tsfile(df, outputPath, problemName, class_value_list=annotationVec, univariate=isUniVariate, equal_length=False)
+    annotations = read_edf_annotations(annotationFile)
+    observations = (
+        observation
+        for observation, _ in iter_edf_observations(signalFile, annotations)
+    )
+    write_jaggeddf_to_tsfile(
+        observations,
+        outputPath,
+        problem_name=problemName,
+        class_value_list=[description for _, _, description in annotations],
+        univariate=isUniVariate,
+    )
 
 
 if __name__ == "__main__":
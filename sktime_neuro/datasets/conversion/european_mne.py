@@ -1,6 +1,9 @@
 import itertools
 import os
+import shutil
 import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import mne.io
 from typing import List, Dict
@@ -19,14 +22,18 @@ def write_jaggeddf_to_tsfile(
     missing_values="NaN",
     comment=None,
     fold="",
+    precision=None,
+    univariate=False,
 ):
     """
     Output a dataset in jagged dataframe format to .ts file.
 
     Parameters
     ----------
-    data: Jagged 3d List
+    data: Jagged 3d List or iterable of cases
         The list corresponding to the structure found here examples/loading_data.ipynb.
+        Cases can also come from a generator, then every case is written as soon
+        as it is yielded and the number of cases is not checked.
     path: str
         The full path to output the ts file to.
     problem_name: str, default="sample_data"
@@ -47,6 +54,11 @@ def write_jaggeddf_to_tsfile(
         Comment text to be inserted before the header in a block.
     fold: str or None, default=None
         Addon at the end of the filename, i.e. _TRAIN or _TEST.
+    precision: int or None, default=None
+        Number of significant digits to write values with, if None values are
+        written like str() would, which round trips exactly.
+    univariate: bool, default=False
+        Indicates whether each case has a single dimension.
 
     Returns
     -------
@@ -57,15 +69,16 @@ def write_jaggeddf_to_tsfile(
     This is a hacked up version of the write_ndarray_to_tsfile from sktime's data_io, as that doesn't work with any
     uneqal length dataframes
     """
-
-
-    univariate = False
     if class_value_list is not None and class_label is None:
         class_label = np.unique(class_value_list)
     elif class_value_list is None:
         class_value_list = []
     # ensure number of cases is same as the class value list
-    if len(data) != len(class_value_list) and len(class_value_list) > 0:
+    if (
+        hasattr(data, "__len__")
+        and len(data) != len(class_value_list)
+        and len(class_value_list) > 0
+    ):
         raise IndexError(
             "The number of cases is not the same as the number of given class values"
         )
@@ -81,45 +94,82 @@ def write_jaggeddf_to_tsfile(
         os.makedirs(dirt)
     except os.error:
         pass  # raises os.error if path already exists
-    # create ts file in the path
-    file = open(f"{dirt}{str(problem_name)}{fold}.ts", "w")
-    # write comment if any as a block at start of file
-    if comment is not None:
-        file.write("\n# ".join(textwrap.wrap("# " + comment)))
-        file.write("\n")
-    # begin writing header information
-    file.write(f"@problemName {problem_name}\n")
-    file.write("@timestamps false\n")
-    file.write(f"@univariate {str(univariate).lower()}\n")
-    file.write(f"@equalLength {str(equal_length).lower()}\n")
-    if series_length > 0 and equal_length:
-        file.write(f"@seriesLength {series_length}\n")
-    # write class label line
-    if class_label is not None:
-        space_separated_class_label = " ".join(str(label) for label in class_label)
-        file.write(f"@classLabel true {space_separated_class_label}\n")
+    if precision is None:
+        formatValues = _formatShortest
     else:
-        file.write("@class_label false\n")
-    # begin writing the core data for each case
-    # which are the series and the class value list if there is any
-    file.write("@data\n")
-    for case, value in itertools.zip_longest(data, class_value_list):
-        for dimension in case:
-            # turn series into comma-separated row
-            series = ",".join(
-                [str(num) if not np.isnan(num) else missing_values for num in dimension]
-            )
-            file.write(str(series))
-            # continue with another dimension for multivariate case
-            if not univariate:
-                file.write(":")
+        formatValues = _formatPrecision(precision)
+    # create ts file in the path, buffered so that each case is written at once
+    tsFile = f"{dirt}{str(problem_name)}{fold}.ts"
+    with open(tsFile, "w", buffering=_bufferSize) as file:
+        # write comment if any as a block at start of file
+        if comment is not None:
+            file.write("\n# ".join(textwrap.wrap("# " + comment)))
+            file.write("\n")
+        # begin writing header information
+        file.write(f"@problemName {problem_name}\n")
+        file.write("@timestamps false\n")
+        file.write(f"@univariate {str(univariate).lower()}\n")
+        file.write(f"@equalLength {str(equal_length).lower()}\n")
+        if series_length > 0 and equal_length:
+            file.write(f"@seriesLength {series_length}\n")
+        # write class label line
+        if class_label is not None:
+            space_separated_class_label = " ".join(str(label) for label in class_label)
+            file.write(f"@classLabel true {space_separated_class_label}\n")
+        else:
+            file.write("@class_label false\n")
+        # begin writing the core data for each case
+        # which are the series and the class value list if there is any
+        file.write("@data\n")
         a = ":" if univariate else ""
-        if value is not None:
-            file.write(f"{a}{value}")  # write the case value if any
-        elif class_label is not None:
-            file.write(f"{a}{missing_values}")
-        file.write("\n")  # open a new line
-    file.close()
+        # continue with another dimension for multivariate case
+        separator = "" if univariate else ":"
+        for case, value in itertools.zip_longest(data, class_value_list):
+            # turn each series into a comma-separated row in one go
+            line = "".join(
+                formatValues(np.asarray(dimension), missing_values) + separator
+                for dimension in case
+            )
+            if value is not None:
+                line += f"{a}{value}"  # write the case value if any
+            elif class_label is not None:
+                line += f"{a}{missing_values}"
+            file.write(line + "\n")
+
+
+_bufferSize = 1 << 20
+
+
+def _formatShortest(values, missing_values):
+    """Join values with commas, formatting each like str() does."""
+    if values.dtype.kind == "f" and values.dtype.itemsize < 8:
+        # python floats would show the digits of the double precision value
+        row = ",".join(map(str, values))
+    else:
+        row = ",".join(map(str, values.tolist()))
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        row = _replaceNan(row, missing_values)
+    return row
+
+
+def _formatPrecision(precision):
+    """Return a formatter joining values with the given significant digits."""
+    fmt = f"%.{precision}g"
+
+    def formatValues(values, missing_values):
+        # one format string for the whole row, like np.savetxt
+        row = ",".join([fmt] * len(values)) % tuple(values.tolist())
+        if values.dtype.kind == "f" and np.isnan(values).any():
+            row = _replaceNan(row, missing_values)
+        return row
+
+    return formatValues
+
+
+def _replaceNan(row, missing_values):
+    """Replace the nan entries of a comma-separated row."""
+    return ",".join(missing_values if v == "nan" else v for v in row.split(","))
+
 
 def loadAliceSleepData(): # If you only want to test on Alice
     return mne.datasets.sleep_physionet.age.fetch_data(subjects=[0], recording=[1], path="edfdatasets/")
@@ -143,35 +193,40 @@ def readRawAndSetAnnot(subject):
     raw.set_annotations(annotation)
     return raw
 
-def extractData(raw):
-    channelList = []
-    channelNames = []
-    #Get the channel ids, the names and the data and put it in one nice list
-    for i in range(len(raw.ch_names)):
-        channelList.append({"ID" : i, "Name" : raw.ch_names[i], "Data" : raw[i]})
-        channelNames.append(raw.ch_names[i])
-
-    eventList = mne.events_from_annotations(raw)[0] #Times (in samples) and the class they belong to
-    classLabels = list(mne.events_from_annotations(raw)[1].items()) # Names for the class labels
-    classData = []
-    classValues = []
-    counter = 0
-    #Iteerate though all channels and store (seperate each channel) until we reach a new event, in which create new array
-    while counter < len(eventList)-1: #While we still got events to process, last event is always useless
-        min = eventList[counter][0]
-        if counter + 1 >= len(eventList):
-            max = len(channelList[0]['Data'][0][0]) ## Total samples
-        else:
-            max = eventList[counter+1][0]
-        tempArr = []
-        for i in range(len(channelList)): #Iterate through the channels
-            s = channelList[i]['Data'][0][0][min:max]
-            tempArr.append(s)
-        classData.append(tempArr) #Append to current working list
-        classValues.append(eventList[counter][2])
-        counter += 1
+def extractData(raw, event_id=None):
+    """
+    Segment the raw data into one case per event.
+
+    Every case reaches from the onset of an event to the onset of the next
+    one, the last event only marks the end of the data. The data is read
+    once and split along the samples, so all cases are views into it.
+
+    Parameters
+    ----------
+    raw : Object
+        MNE raw object with annotations
+    event_id : dict or None
+        mapping from descriptions to class values, see
+        ``mne.events_from_annotations``
+
+    Returns
+    -------
+    list
+        the cases, each a list of one array per channel,
+        the (description, class value) pairs and the class value of each case
+    """
+    # times (in samples) and the class they belong to
+    eventList, eventIds = mne.events_from_annotations(raw, event_id=event_id)
+    classLabels = list(eventIds.items())  # names for the class labels
+    data = raw.get_data()
+    # event samples count from the start of the recording, not of raw
+    segments = np.split(data, eventList[:, 0] - raw.first_samp, axis=1)
+    # drop the data before the first and after the last event
+    classData = [list(segment) for segment in segments[1:-1]]
+    classValues = list(eventList[:-1, 2])
     return [classData, classLabels, classValues]
 
+
 def conversionPipeline(subject, path="./", problem_name="Test"): #For now only take a subject
     raw = readRawAndSetAnnot(subject)
     [classData, classLabels, classValues] = extractData(raw)
@@ -179,6 +234,107 @@ def conversionPipeline(subject, path="./", problem_name="Test"): #For now only t
     pathToWrite = "./"
     write_jaggeddf_to_tsfile(classData, pathToWrite, problem_name=name, class_label=classLabels, class_value_list=pd.Series(classValues))
 
+
+def convertSubjects(
+    subjects,
+    path="./",
+    problem_name="sample_data",
+    n_jobs=1,
+    keep_shards=False,
+    verbose=True,
+):
+    """
+    Convert many subjects into one .ts file, one subject per process.
+
+    Every subject is converted like in ``conversionPipeline`` and written
+    to its own shard, at most n_jobs subjects at a time. The shards are
+    then merged in the order of subjects into path/problem_name/problem_name.ts.
+    To get the same class values for all subjects, the event ids are
+    created from the descriptions of all annotation files beforehand.
+
+    Parameters
+    ----------
+    subjects : list of (str, str)
+        paths to the signal and the annotation file of each subject
+    path : str
+        directory to write the dataset to
+    problem_name : str
+        name of the dataset
+    n_jobs : int
+        maximum number of subjects converted at the same time
+    keep_shards : bool
+        keep the per subject files in path/problem_name/shards
+    verbose : bool
+        print the progress
+
+    Returns
+    -------
+    report : pd.DataFrame
+        one row per subject with the number of cases and
+        the seconds it took to convert it
+    """
+    start = time.perf_counter()
+    descriptions = set()
+    for subject in subjects:
+        descriptions.update(mne.read_annotations(subject[1]).description)
+    event_id = {d: i for i, d in enumerate(sorted(descriptions), start=1)}
+
+    shardPath = os.path.join(path, problem_name, "shards")
+    shardNames = [f"{problem_name}_{i:04d}" for i in range(len(subjects))]
+    report = pd.DataFrame(
+        {"subject": [s[0] for s in subjects], "n_cases": 0, "seconds": 0.0}
+    )
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        futures = {
+            executor.submit(_convertSubject, subject, event_id, shardPath, name): i
+            for i, (subject, name) in enumerate(zip(subjects, shardNames))
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            n_cases, seconds = future.result()
+            report.loc[i, ["n_cases", "seconds"]] = n_cases, seconds
+            if verbose:
+                print(
+                    f"[{done}/{len(subjects)}] {subjects[i][0]}: "
+                    f"{n_cases} cases in {seconds:.1f}s"
+                )
+
+    # write the header and append the data of every shard
+    write_jaggeddf_to_tsfile(
+        [], path, problem_name=problem_name, class_label=list(event_id.values())
+    )
+    with open(os.path.join(path, problem_name, f"{problem_name}.ts"), "a") as file:
+        for name in shardNames:
+            with open(os.path.join(shardPath, name, f"{name}.ts")) as shard:
+                for line in shard:
+                    if line.startswith("@data"):
+                        break
+                shutil.copyfileobj(shard, file)
+    if not keep_shards:
+        shutil.rmtree(shardPath)
+    if verbose:
+        print(
+            f"Converted {len(subjects)} subjects with {report['n_cases'].sum()} cases "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+    return report
+
+
+def _convertSubject(subject, event_id, path, problem_name):
+    """Convert one subject to a shard, return number of cases and seconds."""
+    start = time.perf_counter()
+    raw = readRawAndSetAnnot(subject)
+    [classData, classLabels, classValues] = extractData(raw, event_id=event_id)
+    write_jaggeddf_to_tsfile(
+        classData,
+        path,
+        problem_name=problem_name,
+        class_label=list(event_id.values()),
+        class_value_list=pd.Series(classValues),
+    )
+    return len(classData), time.perf_counter() - start
+
+
 if __name__ == "__main__":
     conversionPipeline(loadAliceSleepData())
     testload = load_UCR_UEA_dataset("test")
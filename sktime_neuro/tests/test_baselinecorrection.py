@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sktime_neuro.transformations.panel.baselinecorrection import (
+    BaselineCorrectionTransformer,
+)
+
+
+# Check the results against the trial- and channelwise definition
+@pytest.mark.parametrize("method", ["mean", "median", "zscore"])
+@pytest.mark.parametrize("lower, upper", [(None, None), (0, 0.5), (0.2, 1)])
+def test_baseline_results(method, lower, upper):
+    np.random.seed(42)
+    X = np.random.randn(5, 3, 500) + 2.0
+    Xt = BaselineCorrectionTransformer(
+        lower=lower, upper=upper, fs=250, method=method
+    ).fit_transform(X)
+
+    lower_index = 0 if lower is None else int(lower * 250)
+    upper_index = 500 if upper is None else int(upper * 250)
+    for trial in range(X.shape[0]):
+        for channel in range(X.shape[1]):
+            baseline = X[trial, channel, lower_index:upper_index]
+            if method == "median":
+                expected = X[trial, channel] - np.median(baseline)
+            elif method == "zscore":
+                expected = (X[trial, channel] - baseline.mean()) / baseline.std()
+            else:
+                expected = X[trial, channel] - baseline.mean()
+            assert np.allclose(Xt[trial, channel], expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_dtype_and_in_place(dtype):
+    np.random.seed(42)
+    X = np.random.randn(5, 3, 500).astype(dtype)
+    Xt1 = BaselineCorrectionTransformer(lower=0, upper=0.5, fs=250).fit_transform(X)
+    assert Xt1.dtype == dtype
+    assert Xt1.flags.c_contiguous
+
+    Xt2 = BaselineCorrectionTransformer(
+        lower=0, upper=0.5, fs=250, copy=False
+    ).fit_transform(X)
+    assert np.shares_memory(Xt2, X)
+    assert np.allclose(Xt1, Xt2)
+
+
+def test_integer_input():
+    X = np.arange(60).reshape(2, 3, 10)
+    Xt = BaselineCorrectionTransformer(copy=False).fit_transform(X)
+    assert Xt.dtype == np.float64
+    assert np.allclose(Xt.mean(axis=2), 0)
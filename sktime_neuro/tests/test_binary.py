@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sktime_neuro.datasets.conversion.binary import (
+    load_npy_dataset,
+    npy_dataset_to_ts,
+    ts_to_npy_dataset,
+    write_jagged_to_npy_dataset,
+)
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+
+
+def _make_jagged(n_cases=10, n_dimensions=3, equal_length=False):
+    np.random.seed(42)
+    data = []
+    for _ in range(n_cases):
+        n = 50 if equal_length else np.random.randint(20, 80)
+        data.append([np.random.randn(n) for _ in range(n_dimensions)])
+    return data, np.random.choice(["a", "b"], n_cases)
+
+
+def test_round_trip(tmp_path):
+    data, y = _make_jagged()
+    write_jagged_to_npy_dataset(data, str(tmp_path), "jagged", y, fold="_TRAIN")
+    X, y2 = load_npy_dataset(str(tmp_path), "jagged", fold="_TRAIN")
+    assert np.array_equal(y, y2)
+    for case, case2 in zip(data, X):
+        for s, s2 in zip(case, case2):
+            assert isinstance(s2, np.memmap)
+            assert np.array_equal(s, s2)
+
+    X, _ = load_npy_dataset(str(tmp_path), "jagged", "_TRAIN", "nested_univ")
+    assert X.shape == (10, 3)
+    assert np.array_equal(X.iloc[3, 2], data[3][2])
+    with pytest.raises(ValueError):
+        load_npy_dataset(str(tmp_path), "jagged", "_TRAIN", "numpy3D")
+
+
+def test_numpy3d(tmp_path):
+    data, y = _make_jagged(equal_length=True)
+    write_jagged_to_npy_dataset(data, str(tmp_path), "equal", y)
+    X, _ = load_npy_dataset(str(tmp_path), "equal", return_type="numpy3D")
+    assert X.shape == (10, 3, 50)
+    assert np.array_equal(X, np.array(data))
+
+
+def test_ts_round_trip(tmp_path):
+    data, y = _make_jagged()
+    write_jaggeddf_to_tsfile(data, str(tmp_path), "jagged", class_value_list=y)
+    ts_file = str(tmp_path / "jagged" / "jagged.ts")
+    ts_to_npy_dataset(ts_file, str(tmp_path / "npy"), "jagged")
+    X, y2 = load_npy_dataset(str(tmp_path / "npy"), "jagged")
+    assert np.array_equal(y, y2)
+    for case, case2 in zip(data, X):
+        assert all(np.array_equal(s, s2) for s, s2 in zip(case, case2))
+
+    npy_dataset_to_ts(str(tmp_path / "npy"), "jagged", str(tmp_path / "ts"))
+    with open(ts_file) as f1, open(tmp_path / "ts" / "jagged" / "jagged.ts") as f2:
+        assert f1.read() == f2.read()
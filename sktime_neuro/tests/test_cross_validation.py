@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_predict
+from threadpoolctl import threadpool_info
+
+from sktime_neuro.benchmarking import cross_validation
+from sktime_neuro.benchmarking.cross_validation import (
+    _fit_and_predict_fold,
+    cross_val_train_probs,
+)
+
+
+def _make_data(seed=0):
+    rng = np.random.RandomState(seed)
+    y = np.repeat(["a", "b", "c"], 20)
+    X = rng.randn(len(y), 5) + (y == "b")[:, None] - (y == "c")[:, None]
+    return X, y
+
+
+# Check that the probabilities are the ones of cross_val_predict
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_same_as_cross_val_predict(n_jobs):
+    X, y = _make_data()
+    classifier = LogisticRegression()
+    expected = cross_val_predict(classifier, X, y, cv=10, method="predict_proba")
+    probs, folds = cross_val_train_probs(classifier, X, y, cv=10, n_jobs=n_jobs)
+    np.testing.assert_allclose(probs, expected)
+    assert len(folds) == 10
+    assert sum(fold["n_test"] for fold in folds) == len(y)
+    for fold in folds:
+        assert fold["fit"]["wall_ns"] > 0
+        assert "wall_ns" in fold["predict_proba"]
+        assert not fold["reused"]
+
+
+# Check that stored fold models are reused only for the same parameters
+def test_reuse_fold_models(tmp_path):
+    X, y = _make_data()
+    fold_dir = str(tmp_path / "folds")
+    probs, _ = cross_val_train_probs(
+        LogisticRegression(), X, y, cv=5, fold_model_dir=fold_dir
+    )
+    assert len(os.listdir(fold_dir)) == 5
+
+    reused_probs, folds = cross_val_train_probs(
+        LogisticRegression(), X, y, cv=5, fold_model_dir=fold_dir
+    )
+    assert all(fold["reused"] for fold in folds)
+    np.testing.assert_array_equal(reused_probs, probs)
+
+    _, folds = cross_val_train_probs(
+        LogisticRegression(C=0.1), X, y, cv=5, fold_model_dir=fold_dir
+    )
+    assert not any(fold["reused"] for fold in folds)
+
+
+# Check that serial folds keep all threads unless limited explicitly
+def test_threads_per_fold():
+    X, y = _make_data()
+    n_threads = max([info["num_threads"] for info in threadpool_info()], default=0)
+    _, folds = cross_val_train_probs(LogisticRegression(), X, y, cv=3)
+    assert all(fold["fit"]["n_blas_threads"] == n_threads for fold in folds)
+    _, folds = cross_val_train_probs(
+        LogisticRegression(), X, y, cv=3, threads_per_fold=1
+    )
+    assert all(fold["fit"]["n_blas_threads"] == min(n_threads, 1) for fold in folds)
+
+
+# Check that the folds get unfitted clones of a fitted classifier
+def test_fitted_classifier_not_sent(monkeypatch):
+    X, y = _make_data()
+    classifier = LogisticRegression().fit(X, y)
+    sent = []
+
+    def fit_and_predict_fold(fold_classifier, *args):
+        sent.append(fold_classifier is classifier or hasattr(fold_classifier, "coef_"))
+        return _fit_and_predict_fold(fold_classifier, *args)
+
+    monkeypatch.setattr(cross_validation, "_fit_and_predict_fold", fit_and_predict_fold)
+    cross_val_train_probs(classifier, X, y, cv=3)
+    assert sent == [False, False, False]
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+import pytest
+from sktime.datasets import load_from_tsfile_to_dataframe
+
+from sktime_neuro.datasets.conversion import binary
+from sktime_neuro.datasets.conversion.european_mne import write_jaggeddf_to_tsfile
+from sktime_neuro.utils import dataset_cache
+from sktime_neuro.utils.dataset_cache import clear_dataset_cache, load_dataset
+
+
+def _write_ts(path, name, seed=42):
+    rng = np.random.RandomState(seed)
+    data = [[rng.randn(n), rng.randn(n)] for n in (10, 15, 12, 20)]
+    write_jaggeddf_to_tsfile(
+        data, path, problem_name=name, class_value_list=["a", "b", "a", "b"]
+    )
+    return os.path.join(path, name, f"{name}.ts")
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    clear_dataset_cache()
+    yield
+    clear_dataset_cache()
+
+
+def _assert_same(X1, y1, X2, y2):
+    assert list(X1.columns) == list(X2.columns)
+    assert np.array_equal(y1, y2)
+    for row1, row2 in zip(X1.itertuples(index=False), X2.itertuples(index=False)):
+        for s1, s2 in zip(row1, row2):
+            assert np.array_equal(np.asarray(s1), np.asarray(s2))
+
+
+# Check that a dataset is parsed once and then kept in memory and on disk
+def test_load_dataset(tmp_path, monkeypatch):
+    file = _write_ts(str(tmp_path), "data")
+    X, y = load_dataset(file, cache_dir=str(tmp_path / "cache"))
+    _assert_same(X, y, *load_from_tsfile_to_dataframe(file))
+    assert load_dataset(file, cache_dir=str(tmp_path / "cache"))[0] is X
+
+    def parse(file):
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(binary, "load_from_tsfile_to_dataframe", parse)
+    clear_dataset_cache()
+    X2, y2 = load_dataset(file, cache_dir=str(tmp_path / "cache"))
+    assert X2 is not X
+    _assert_same(X, y, X2, y2)
+
+
+# Check that a modified file is parsed again
+def test_load_dataset_modified(tmp_path):
+    file = _write_ts(str(tmp_path), "data")
+    load_dataset(file, cache_dir=str(tmp_path / "cache"))
+    stat = os.stat(file)
+    _write_ts(str(tmp_path), "data", seed=0)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    X, y = load_dataset(file, cache_dir=str(tmp_path / "cache"))
+    _assert_same(X, y, *load_from_tsfile_to_dataframe(file))
+
+
+# Check that only the most recently used datasets are kept in memory
+def test_load_dataset_lru(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_cache, "_max_datasets", 2)
+    files = [_write_ts(str(tmp_path), f"data{i}") for i in range(3)]
+    X0 = load_dataset(files[0])[0]
+    X1 = load_dataset(files[1])[0]
+    assert load_dataset(files[0])[0] is X0
+    load_dataset(files[2])
+    assert load_dataset(files[0])[0] is X0
+    assert load_dataset(files[1])[0] is not X1
+
+
+# Check that a dataset is still loaded if the cache cannot be written
+def test_load_dataset_no_cache(tmp_path):
+    file = _write_ts(str(tmp_path), "data")
+    # a directory below a file cannot be created, not even by root
+    with pytest.warns(UserWarning, match="without the dataset cache"):
+        X, y = load_dataset(file, cache_dir=os.path.join(file, "cache"))
+    _assert_same(X, y, *load_from_tsfile_to_dataframe(file))
+    assert load_dataset(file, cache_dir=os.path.join(file, "cache"))[0] is X
+
+
+# Check that the loaded data can be changed without changing the cache
+def test_load_dataset_copy_on_write(tmp_path):
+    file = _write_ts(str(tmp_path), "data")
+    cache_dir = str(tmp_path / "cache")
+    X, y = load_dataset(file, cache_dir=cache_dir)
+    values = X.iloc[0, 0].values
+    assert isinstance(values.base, np.memmap)
+    values[0] = 1e9
+    assert values[0] == 1e9
+    clear_dataset_cache()
+    X2, y2 = load_dataset(file, cache_dir=cache_dir)
+    _assert_same(X2, y2, *load_from_tsfile_to_dataframe(file))
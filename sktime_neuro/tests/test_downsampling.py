@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from scipy import signal
+from sktime_neuro.transformations.panel.paneldownsampling import PanelDownsampling
+from sktime_neuro.transformations.series.seriesdownsampling import (
+    SeriesDownsampling,
+)
+
+
+@pytest.mark.parametrize("factor", [1, 2, 3])
+def test_decimate(factor):
+    np.random.seed(42)
+    X = np.random.randn(5, 3, 500)
+    Xt = PanelDownsampling(factor=factor).fit_transform(X)
+    assert np.array_equal(Xt, X[:, :, ::factor])
+    Zt = SeriesDownsampling(factor=factor).fit_transform(X[0].T)
+    assert np.array_equal(Zt, X[0].T[::factor])
+
+
+# Check rational factors and the resulting sampling frequency
+@pytest.mark.parametrize(
+    "target_fs, up, down", [(125, 1, 2), (100, 2, 5), (128, 64, 125)]
+)
+def test_polyphase(target_fs, up, down):
+    np.random.seed(42)
+    X = np.random.randn(5, 3, 500)
+    Downsampling = PanelDownsampling(fs=250, method="polyphase", target_fs=target_fs)
+    Xt = Downsampling.fit_transform(X)
+    assert (Downsampling.up_, Downsampling.down_) == (up, down)
+    assert Downsampling.fs_ == target_fs
+    assert np.allclose(Xt, signal.resample_poly(X, up, down, axis=2))
+
+    Downsampling = SeriesDownsampling(fs=250, method="polyphase", target_fs=target_fs)
+    Zt = Downsampling.fit_transform(X[0].T)
+    assert Downsampling.fs_ == target_fs
+    assert np.allclose(Zt, Xt[0].T)
+
+
+# Check that frequencies above the new Nyquist frequency are removed
+def test_polyphase_anti_aliasing():
+    t = np.arange(1000) / 250
+    X = np.sin(2 * np.pi * 90 * t).reshape(1, 1, -1)
+    Xt1 = PanelDownsampling(factor=2).fit_transform(X)
+    Xt2 = PanelDownsampling(factor=2, method="polyphase").fit_transform(X)
+    assert np.abs(Xt1).max() > 0.5
+    assert np.abs(Xt2[:, :, 50:-50]).max() < 0.05
+
+
+def test_bad_input_args():
+    with pytest.raises(TypeError):
+        PanelDownsampling(factor=1.5)
+    with pytest.raises(ValueError):
+        PanelDownsampling(target_fs=100, fs=250)
+    with pytest.raises(ValueError):
+        SeriesDownsampling(method="polyphase", target_fs=100)
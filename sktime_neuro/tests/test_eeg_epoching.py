@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from sktime_neuro.transformations.series_to_panel.eeg_epoching import epoch
+
+
+def _make_data(onsets, sfreq=250):
+    np.random.seed(42)
+    Z = np.random.randn(int((max(onsets) + 3) * sfreq), 8)
+    annotation = pd.DataFrame(
+        {
+            "onset": onsets,
+            "duration": 0.0,
+            "description": np.resize(["left", "right", "rest"], len(onsets)),
+        }
+    )
+    return Z, annotation
+
+
+# Check that the vectorized epoching agrees with the loop
+@pytest.mark.parametrize("interval", [(0, 1), (-0.5, 1.5), (0.2, 0.7)])
+@pytest.mark.parametrize("labels", [["left"], ["left", "right"]])
+def test_vectorized_equals_loop(interval, labels):
+    Z, annotation = _make_data(np.arange(1, 30, 0.7))
+    X1, y1 = epoch(Z, annotation, labels, interval, 250, method="loop")
+    X2, y2 = epoch(Z, annotation, labels, interval, 250, method="vectorized")
+    assert X1.shape == X2.shape
+    assert np.array_equal(X1, X2)
+    assert np.array_equal(y1, y2)
+
+
+# Check that evenly spaced events can be returned as a read-only view
+def test_view():
+    Z, annotation = _make_data(np.arange(1, 30, 0.8))
+    X1, _ = epoch(Z, annotation, ["left", "right", "rest"], (-0.5, 1), 250)
+    X2, _ = epoch(Z, annotation, ["left", "right", "rest"], (-0.5, 1), 250, copy=False)
+    assert np.shares_memory(X2, Z)
+    assert not X2.flags.writeable
+    assert np.array_equal(X1, X2)
+
+
+# Check that windows outside of the recording are rejected
+@pytest.mark.parametrize("interval", [(-2, 1), (0, 10)])
+def test_interval_out_of_bounds(interval):
+    Z, annotation = _make_data(np.arange(1, 10, 1.0))
+    with pytest.raises(ValueError):
+        epoch(Z, annotation, ["left"], interval, 250)
+
+
+# Check that copies have the type and memory layout of the loop's output
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int16])
+def test_dtype_and_layout(dtype):
+    Z, annotation = _make_data(np.arange(1, 30, 0.7))
+    Z = (100 * Z).astype(dtype)
+    X1, _ = epoch(Z, annotation, ["left"], (-0.5, 1), 250, method="loop")
+    X2, _ = epoch(Z, annotation, ["left"], (-0.5, 1), 250, method="vectorized")
+    assert X2.dtype == X1.dtype == np.float64
+    assert X1.flags.c_contiguous and X2.flags.c_contiguous
+    assert np.array_equal(X1, X2)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import gc
+import weakref
+
+import numpy as np
+import pytest
+from sktime.datasets import load_from_tsfile_to_dataframe
+
+pyedflib = pytest.importorskip("pyedflib")
+
+from sktime_neuro.datasets.conversion import european  # noqa: E402
+from sktime_neuro.datasets.conversion.european import (  # noqa: E402
+    iter_edf_observations,
+    read_edf_annotations,
+)
+
+
+def _write_edf(path, sfreq=100, n_seconds=60):
+    np.random.seed(42)
+    signals = np.random.uniform(-100, 100, (2, n_seconds * sfreq))
+    headers = pyedflib.highlevel.make_signal_headers(
+        ["Fpz-Cz", "Pz-Oz"], sample_frequency=sfreq
+    )
+    header = pyedflib.highlevel.make_header()
+    header["annotations"] = [[0.0, 30.0, "W"], [30.0, 20.0, "N1"], [50.0, 30.0, "N2"]]
+    pyedflib.highlevel.write_edf(str(path), signals, headers, header)
+    return pyedflib.highlevel.read_edf(str(path))[0]
+
+
+def test_iter_edf_observations(tmp_path):
+    path = tmp_path / "psg.edf"
+    signals = _write_edf(path)
+    annotations = read_edf_annotations(str(path))
+    assert [a[2] for a in annotations] == ["W", "N1", "N2"]
+
+    observations = list(iter_edf_observations(str(path), annotations))
+    assert [d for _, d in observations] == ["W", "N1", "N2"]
+    for (observation, _), (onset, duration, _) in zip(observations, annotations):
+        start, stop = int(onset * 100), int((onset + duration) * 100)
+        for channel, signal in zip(observation, signals):
+            # the last annotation exceeds the recording
+            assert np.array_equal(channel, signal[start:stop])
+
+    observations = list(iter_edf_observations(str(path), annotations, ["Pz-Oz"]))
+    assert np.array_equal(observations[0][0][0], signals[1][:3000])
+
+
+# Check that handle_multipart writes every observation before reading the next
+def test_handle_multipart(tmp_path, monkeypatch):
+    path = tmp_path / "psg.edf"
+    signals = _write_edf(path)
+    annotations = read_edf_annotations(str(path))
+
+    alive = []
+
+    def iter_observations(*args, **kwargs):
+        for i, (observation, description) in enumerate(
+            iter_edf_observations(*args, **kwargs)
+        ):
+            # the writer may still hold the last case, but none before it
+            gc.collect()
+            assert not any(ref() is not None for ref in alive[: i - 1])
+            alive.extend(weakref.ref(channel) for channel in observation)
+            yield observation, description
+
+    monkeypatch.setattr(european, "iter_edf_observations", iter_observations)
+    european.handle_multipart(str(path), str(path), str(tmp_path), "psg", False)
+
+    X, y = load_from_tsfile_to_dataframe(str(tmp_path / "psg" / "psg.ts"))
+    # the class labels are read lower case
+    assert list(y) == ["w", "n1", "n2"]
+    for (_, row), (onset, duration, _) in zip(X.iterrows(), annotations):
+        start, stop = int(onset * 100), int((onset + duration) * 100)
+        for channel, signal in zip(row, signals):
+            assert np.allclose(channel.to_numpy(), signal[start:stop])
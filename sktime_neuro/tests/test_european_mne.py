@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import mne
+import numpy as np
+import pytest
+
+pyedflib = pytest.importorskip("pyedflib")
+
+from sktime_neuro.datasets.conversion.european_mne import (  # noqa: E402
+    convertSubjects,
+    extractData,
+    write_jaggeddf_to_tsfile,
+)
+
+
+def _write_subject(tmp_path, i, descriptions):
+    np.random.seed(i)
+    signals = np.random.uniform(-100, 100, (2, 60 * 100))
+    headers = pyedflib.highlevel.make_signal_headers(
+        ["Fpz-Cz", "Pz-Oz"], sample_frequency=100
+    )
+    path = str(tmp_path / f"subject{i}.edf")
+    pyedflib.highlevel.write_edf(path, signals, headers)
+    annotation_path = str(tmp_path / f"subject{i}-annot.csv")
+    onsets = 10.0 * np.arange(len(descriptions))
+    mne.Annotations(onsets, 10.0, descriptions).save(annotation_path)
+    return path, annotation_path
+
+
+def _data_lines(path):
+    with open(path) as f:
+        lines = f.read().splitlines()
+    return lines[lines.index("@data") + 1 :]
+
+
+def test_convert_subjects(tmp_path):
+    subjects = [
+        _write_subject(tmp_path, 0, ["W", "N1", "W", "N2"]),
+        _write_subject(tmp_path, 1, ["N2", "N3", "N2", "W", "N1"]),
+        _write_subject(tmp_path, 2, ["W", "W", "N1"]),
+    ]
+    report = convertSubjects(subjects, str(tmp_path), "sleep", n_jobs=2, verbose=False)
+    assert list(report["n_cases"]) == [3, 4, 2]
+    with open(tmp_path / "sleep" / "sleep.ts") as f:
+        assert "@classLabel true 1 2 3 4\n" in f.read()
+    lines = _data_lines(tmp_path / "sleep" / "sleep.ts")
+    assert len(lines) == 9
+    assert [line.rsplit(":", 1)[1] for line in lines[:3]] == ["4", "1", "4"]
+    assert not (tmp_path / "sleep" / "shards").exists()
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_write_jaggeddf_to_tsfile(tmp_path, dtype):
+    data = [
+        [np.array([0.1, np.nan, 3.0]), np.array([1e-7, 2.5])],
+        [np.array([1 / 3]), np.array([-4.0, 5.0, 6.25])],
+    ]
+    data = [[dimension.astype(dtype) for dimension in case] for case in data]
+    write_jaggeddf_to_tsfile(data, str(tmp_path), "jagged", class_value_list=[1, 2])
+    expected = [
+        ":".join(
+            ",".join("NaN" if np.isnan(v) else str(v) for v in dimension)
+            for dimension in case
+        )
+        + f":{value}"
+        for case, value in zip(data, [1, 2])
+    ]
+    assert _data_lines(tmp_path / "jagged" / "jagged.ts") == expected
+
+    write_jaggeddf_to_tsfile(data, str(tmp_path), "jagged", precision=3)
+    lines = _data_lines(tmp_path / "jagged" / "jagged.ts")
+    assert lines[0] == "0.1,NaN,3:1e-07,2.5:"
+    assert lines[1] == "0.333:-4,5,6.25:"
+
+
+def test_extract_data():
+    np.random.seed(42)
+    data = np.random.randn(3, 6000)
+    info = mne.create_info(["Fpz-Cz", "Pz-Oz", "EOG"], 100.0, "eeg")
+    raw = mne.io.RawArray(data, info, verbose=False)
+    onsets = [5.0, 12.5, 30.0, 41.0]
+    raw.set_annotations(mne.Annotations(onsets, 1.0, ["W", "N1", "W", "N2"]))
+    classData, classLabels, classValues = extractData(raw)
+    assert classLabels == [("N1", 1), ("N2", 2), ("W", 3)]
+    assert classValues == [3, 1, 3]
+    bounds = [(500, 1250), (1250, 3000), (3000, 4100)]
+    assert len(classData) == len(bounds)
+    for case, (start, stop) in zip(classData, bounds):
+        assert len(case) == 3
+        for channel, row in zip(case, data):
+            assert np.array_equal(channel, row[start:stop])
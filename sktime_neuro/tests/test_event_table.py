@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import mne
+import numpy as np
+import pandas as pd
+import pytest
+from sktime_neuro.transformations.series_to_panel.eeg_epoching import epoch
+from sktime_neuro.utils.event_table import EventTable
+from sktime_neuro.utils.mne_processing import create_annotation
+
+
+def _make_annotation(n_events=40, sfreq=250):
+    np.random.seed(42)
+    # onsets on whole samples, so seconds and samples convert exactly
+    onsets = np.sort(np.random.choice(np.arange(sfreq, 30 * sfreq), n_events, False))
+    return pd.DataFrame(
+        {
+            "onset": onsets / sfreq,
+            "duration": 0.5,
+            "description": np.random.choice(["left", "right", "rest"], n_events),
+        }
+    )
+
+
+def test_pandas_round_trip():
+    annotation = _make_annotation()
+    events = EventTable.from_pandas(annotation, 250)
+    assert len(events) == len(annotation)
+    assert list(events.labels) == ["left", "rest", "right"]
+    assert np.array_equal(events.description, annotation["description"])
+    pd.testing.assert_frame_equal(events.to_pandas(categorical=False), annotation)
+    # categorical descriptions keep their categories as vocabulary
+    events = EventTable.from_pandas(events.to_pandas(), 250)
+    assert np.array_equal(events.description, annotation["description"])
+
+
+def test_mne_round_trip():
+    annotation = _make_annotation()
+    info = mne.create_info(ch_names=["C3", "C4"], ch_types="eeg", sfreq=250)
+    raw = mne.io.RawArray(np.zeros((2, 40 * 250)), info, verbose=False)
+    raw.set_annotations(EventTable.from_pandas(annotation, 250).to_mne())
+    events = EventTable.from_mne(raw)
+    assert np.array_equal(events.onset, EventTable.from_pandas(annotation, 250).onset)
+    pd.testing.assert_frame_equal(
+        events.to_pandas(categorical=False), create_annotation(raw, categorical=False)
+    )
+
+
+def test_select():
+    events = EventTable.from_pandas(_make_annotation(), 250)
+    selected = events.select(["left", "right"])
+    mask = events.mask(["left", "right"])
+    assert np.array_equal(selected.description, events.description[mask])
+    assert set(selected.description) == {"left", "right"}
+    # resampling onsets to a lower sampling frequency
+    assert np.array_equal(events.sample_onsets(125), events.onset // 2)
+
+
+def test_invalid_codes():
+    with pytest.raises(ValueError):
+        EventTable([0, 10], [0, 2], ["left", "right"], 250)
+
+
+# Check that epoching with an event table agrees with the annotation
+def test_epoch_event_table():
+    annotation = _make_annotation()
+    Z = np.random.randn(32 * 250, 4)
+    X1, y1 = epoch(Z, annotation, ["left", "right"], (-0.5, 1), 250)
+    events = EventTable.from_pandas(annotation, 250)
+    X2, y2 = epoch(Z, events, ["left", "right"], (-0.5, 1), 250)
+    assert np.array_equal(X1, X2)
+    assert np.array_equal(y1, y2)
@@ -3,6 +3,8 @@ import numpy as np
 import pytest
 from sktime_neuro.transformations.panel.filterforpanel import FilterforPanel
 from mne import filter
+from sktime_neuro.utils import filter_design
+from sktime_neuro.utils.filter_design import clear_filter_cache, filter_cache_info
 
 
 # Check that exception is raised for bad input arguments
@@ -70,3 +72,94 @@ def test_filter_results(sfreq, lfreq, hfreq):
     Xt2 = filter.filter_data(X, sfreq=sfreq, l_freq=lfreq, h_freq=hfreq)
 
     assert np.allclose(Xt1, Xt2)
+
+
+# Check that filters are designed once and shared across instances
+def test_filter_cache():
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(10, 3, 1000)
+    clear_filter_cache()
+    Xt1 = FilterforPanel(sfreq=250, l_freq=1, h_freq=14).fit_transform(X)
+    Xt2 = FilterforPanel(sfreq=250, l_freq=1, h_freq=14, pad="reflect_limited").fit(
+        X
+    )
+    FilterforPanel(sfreq=250, l_freq=2, h_freq=14).fit(X)
+    info = filter_cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+    assert np.allclose(Xt1, Xt2.transform(X))
+
+
+# Check that the batched backend agrees with mne
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"phase": "minimum"},
+        {"phase": "zero-double"},
+        {"pad": "edge"},
+        {"method": "iir"},
+        {"method": "iir", "phase": "forward"},
+    ],
+)
+@pytest.mark.parametrize("lfreq, hfreq", [(1, 20), (None, 20), (10, None)])
+def test_batched_backend(kwargs, lfreq, hfreq):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(20, 5, 1000)
+    Xt1 = filter.filter_data(X, sfreq=250, l_freq=lfreq, h_freq=hfreq, **kwargs)
+
+    Filter = FilterforPanel(
+        sfreq=250, l_freq=lfreq, h_freq=hfreq, backend="batched", **kwargs
+    )
+    Xt2 = Filter.fit_transform(X)
+    assert np.allclose(Xt1, Xt2)
+
+    Filter = FilterforPanel(
+        sfreq=250,
+        l_freq=lfreq,
+        h_freq=hfreq,
+        backend="batched",
+        dtype="float32",
+        **kwargs,
+    ).fit(X)
+    out = np.empty(X.shape, dtype=np.float32)
+    Xt3 = Filter.transform(X, out=out)
+    assert Xt3 is out
+    assert np.allclose(Xt1, Xt3, atol=1e-5)
+
+
+# Check that filtering into out block by block gives the result of one block
+@pytest.mark.parametrize("kwargs", [{}, {"method": "iir"}])
+def test_batched_backend_out_blocks(kwargs, monkeypatch):
+    np.random.seed(42)
+    X = np.random.randn(7, 3, 1000)
+    Filter = FilterforPanel(
+        sfreq=250, l_freq=1, h_freq=20, backend="batched", **kwargs
+    ).fit(X)
+    Xt1 = Filter.transform(X)
+    # one row per block
+    monkeypatch.setattr(filter_design, "_block_bytes", 1)
+    out = np.empty(X.shape)
+    Xt2 = Filter.transform(X, out=out)
+    assert Xt2 is out
+    assert np.allclose(Xt1, Xt2)
+
+
+# Check that arguments a backend cannot honour are rejected
+def test_unsupported_arguments():
+    np.random.seed(42)
+    X = np.random.randn(4, 3, 1000)
+    Filter = FilterforPanel(sfreq=250, l_freq=1, h_freq=20).fit(X)
+    with pytest.raises(ValueError, match="out"):
+        Filter.transform(X, out=np.empty(X.shape))
+
+    Filter = FilterforPanel(
+        sfreq=250, l_freq=1, h_freq=20, backend="batched", n_jobs=2
+    ).fit(X)
+    with pytest.raises(ValueError, match="n_jobs"):
+        Filter.transform(X)
+    Filter = FilterforPanel(
+        sfreq=250, l_freq=1, h_freq=20, backend="batched", n_jobs=1
+    ).fit(X)
+    assert Filter.transform(X).shape == X.shape
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 from sktime_neuro.transformations.series.filterforseries import FilterforSeries
 from mne import filter
+from scipy import signal
 
 
 # Check that exception is raised for bad input arguments
@@ -75,3 +76,61 @@ def test_filter_results(sfreq, lfreq, hfreq):
     Xt2 = filter.filter_data(X, sfreq=sfreq, l_freq=lfreq, h_freq=hfreq).transpose()
 
     assert np.allclose(Xt1, Xt2)
+
+
+# Check that filtering chunk by chunk agrees with one causal pass
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"phase": "minimum"},
+        {"method": "iir", "phase": "forward"},
+        {
+            "method": "iir",
+            "phase": "forward",
+            "iir_params": {"order": 4, "ftype": "butter", "output": "ba"},
+        },
+    ],
+)
+@pytest.mark.parametrize("n_chunks", [1, 7, 100])
+def test_update(kwargs, n_chunks):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(5000, 3)
+    Filter = FilterforSeries(sfreq=250, l_freq=1, h_freq=30, **kwargs).fit(X)
+    Xt1 = np.concatenate([Filter.update(x) for x in np.array_split(X, n_chunks)])
+
+    filt = Filter.filter_
+    if not isinstance(filt, dict):
+        Xt2 = signal.lfilter(filt, 1.0, X, axis=0)
+    elif "sos" in filt:
+        Xt2 = signal.sosfilt(filt["sos"], X, axis=0)
+    else:
+        Xt2 = signal.lfilter(filt["b"], filt["a"], X, axis=0)
+
+    assert np.allclose(Xt1, Xt2)
+
+
+# Check that update agrees with transform apart from the edge padding of FIR filters
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"phase": "minimum"}, {"method": "iir", "phase": "forward"}],
+)
+def test_update_same_as_transform(kwargs):
+    np.random.seed(42)
+    X = np.random.randn(5000, 3)
+    Filter = FilterforSeries(sfreq=250, l_freq=1, h_freq=30, **kwargs).fit(X)
+    Xt1 = np.concatenate([Filter.update(x) for x in np.array_split(X, 7)])
+    Xt2 = Filter.transform(X)
+    n_edge = 0 if isinstance(Filter.filter_, dict) else len(Filter.filter_) - 1
+    assert np.allclose(Xt1[n_edge:], Xt2[n_edge:])
+
+    Filter = FilterforSeries(sfreq=250, l_freq=1, h_freq=30, pad="constant", **kwargs)
+    Filter.fit(X)
+    Xt1 = np.concatenate([Filter.update(x) for x in np.array_split(X, 7)])
+    assert np.allclose(Xt1, Filter.transform(X))
+
+
+def test_update_non_causal():
+    X = np.zeros((1000, 3))
+    Filter = FilterforSeries(sfreq=250, l_freq=1, h_freq=30).fit(X)
+    with pytest.raises(ValueError):
+        Filter.update(X)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sktime_neuro.transformations.panel.baselinecorrection import (
+    BaselineCorrectionTransformer,
+)
+from sktime_neuro.transformations.panel.filterforpanel import FilterforPanel
+from sktime_neuro.transformations.panel.fusedpipeline import FusedPanelPipeline
+from sktime_neuro.transformations.panel.paneldownsampling import PanelDownsampling
+from sktime_neuro.transformations.panel.timeslicing import TimeSlicingTransformer
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [
+            TimeSlicingTransformer(start=0.2, end=1.8, fs=250),
+            BaselineCorrectionTransformer(lower=0, upper=0.2, fs=250),
+            PanelDownsampling(factor=2),
+        ],
+        [
+            BaselineCorrectionTransformer(lower=0.1, upper=0.3, fs=250),
+            PanelDownsampling(factor=3),
+            TimeSlicingTransformer(start=0.1, end=1.2, fs=250 / 3),
+        ],
+        [
+            PanelDownsampling(factor=2),
+            BaselineCorrectionTransformer(fs=125),
+            TimeSlicingTransformer(start=0.5, fs=125),
+            BaselineCorrectionTransformer(lower=0, upper=0.5, fs=125),
+            PanelDownsampling(factor=3),
+        ],
+        [
+            TimeSlicingTransformer(start=0.2, end=1.8, fs=250),
+            FilterforPanel(sfreq=250, l_freq=1, h_freq=30),
+            BaselineCorrectionTransformer(lower=0, upper=0.2, fs=250),
+        ],
+        [
+            TimeSlicingTransformer(start=0.2, end=1.8, fs=250),
+            PanelDownsampling(factor=2),
+        ],
+    ],
+)
+def test_fused_equals_sequential(steps):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(10, 4, 500) + 1.0
+    Xt1 = X
+    for step in steps:
+        Xt1 = step.fit(Xt1).transform(Xt1)
+    Xt2 = FusedPanelPipeline(steps).fit_transform(X)
+    assert Xt1.shape == Xt2.shape
+    assert np.allclose(Xt1, Xt2)
+
+
+def test_invalid_parameters():
+    X = np.zeros((10, 4, 500))
+    pipeline = FusedPanelPipeline(
+        [PanelDownsampling(factor=2), TimeSlicingTransformer(start=1.5, fs=250)]
+    )
+    with pytest.raises(ValueError):
+        pipeline.fit_transform(X)
+
+
+@pytest.mark.parametrize("method", ["median", "zscore"])
+def test_fused_baseline_methods(method):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(10, 4, 500) + 1.0
+    steps = [
+        BaselineCorrectionTransformer(method="mean", fs=250),
+        TimeSlicingTransformer(start=0.2, end=1.8, fs=250),
+        BaselineCorrectionTransformer(lower=0, upper=0.2, fs=250, method=method),
+        PanelDownsampling(factor=2),
+    ]
+    Xt1 = X
+    for step in steps:
+        Xt1 = step.fit(Xt1).transform(Xt1)
+    Xt2 = FusedPanelPipeline(steps).fit_transform(X)
+    assert np.allclose(Xt1, Xt2)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from sktime_neuro.benchmarking.instrumentation import measure
+
+
+@pytest.mark.parametrize("trace_memory", [True, False])
+def test_measure(trace_memory):
+    with measure(trace_memory) as stats:
+        x = np.ones(1_000_000)
+        time.sleep(0.01)
+    assert stats["wall_ns"] >= 10_000_000
+    assert stats["cpu_ns"] >= 0
+    assert stats["n_threads"] >= 1
+    if trace_memory:
+        assert stats["peak_traced_bytes"] >= x.nbytes
+        assert not tracemalloc.is_tracing()
+    else:
+        assert "peak_traced_bytes" not in stats
+
+
+# Check that the peak memory is the one of the block, also for nested blocks
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="Linux only")
+def test_measure_peak_rss():
+    n_bytes = 200 * 2**20
+    with measure() as outer:
+        x = np.ones(n_bytes // 8)
+        del x
+        with measure() as inner:
+            pass
+    with measure() as after:
+        pass
+    assert outer["peak_rss_bytes"] >= n_bytes
+    assert inner["peak_rss_bytes"] < outer["peak_rss_bytes"] - n_bytes // 2
+    assert after["peak_rss_bytes"] < outer["peak_rss_bytes"] - n_bytes // 2
+    assert after["process_peak_rss_bytes"] >= outer["peak_rss_bytes"]
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import os
+
+import mne
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.io
+from sktime_neuro.contrib.load_datasets import load_BNCI_2, load_c4_ds1, load_c4_ds2b
+from sktime_neuro.utils.event_table import EventTable
+from sktime_neuro.utils.mne_processing import create_annotation
+
+
+def _write_c4_ds1(path):
+    np.random.seed(42)
+    scipy.io.savemat(
+        os.path.join(path, "BCICIV_calib_ds1a.mat"),
+        {
+            "cnt": np.random.randint(-500, 500, (5000, 4)).astype(np.int16),
+            "mrk": {"pos": np.arange(100, 4500, 400), "y": np.resize([-1, 1], 11)},
+            "nfo": {"fs": 100},
+        },
+    )
+
+
+def _write_bnci_2(path, lengths=(1000, 1500, 800, 1200, 900)):
+    np.random.seed(42)
+    runs = np.empty((1, len(lengths)), dtype=object)
+    for i, length in enumerate(lengths):
+        runs[0, i] = {
+            "X": np.random.randn(length, 3),
+            "trial": np.arange(50, length - 200, 250).reshape(-1, 1),
+            "y": np.random.randint(1, 3, (len(range(50, length - 200, 250)), 1)),
+        }
+    scipy.io.savemat(os.path.join(path, "S01T.mat"), {"data": runs})
+    return lengths
+
+
+def test_load_c4_ds1_cache(tmp_path):
+    _write_c4_ds1(tmp_path)
+    path = str(tmp_path) + "/"
+    fs, data, annotation = load_c4_ds1(path, "01")
+    assert fs == 100
+    assert data.shape == (5000, 4)
+    assert np.allclose(annotation["onset"], np.arange(1, 45, 4))
+
+    for _ in range(2):
+        fs2, data2, annotation2 = load_c4_ds1(path, "01", cache=True)
+        assert fs2 == fs
+        assert np.array_equal(data2, data)
+        assert annotation2.equals(annotation)
+    assert isinstance(data2, np.memmap)
+
+    # a modified file is parsed again
+    os.utime(os.path.join(path, "BCICIV_calib_ds1a.mat"), ns=(0, 0))
+    _, data3, _ = load_c4_ds1(path, "01", cache=True)
+    assert not isinstance(data3, np.memmap)
+
+
+def test_load_bnci_2(tmp_path):
+    lengths = _write_bnci_2(tmp_path)
+    path = str(tmp_path) + "/"
+    m = scipy.io.loadmat(path + "S01T.mat")
+    fs, data, annotation = load_BNCI_2(path, "01")
+    assert fs == 512
+    assert np.array_equal(data, np.vstack([m["data"][0][i][0][0][0] for i in range(5)]))
+    starts = np.cumsum((0,) + lengths[:-1])
+    onsets = np.concatenate(
+        [m["data"][0][i][0][0][1].flatten() + starts[i] for i in range(5)]
+    )
+    assert np.allclose(annotation["onset"], onsets / 512)
+
+    _, data2, events = load_BNCI_2(path, "01", as_event_table=True, cache=True)
+    assert np.array_equal(data2, data)
+    assert np.array_equal(events.onset, onsets)
+    assert np.array_equal(events.description, annotation["description"])
+
+
+def _make_sessions(path, suffix, sessions):
+    np.random.seed(42)
+    info = mne.create_info(["C3", "Cz", "C4", "EOG"], 250.0, ["eeg"] * 3 + ["eog"])
+    raws = {}
+    for i, n in sessions:
+        raw = mne.io.RawArray(np.random.randn(4, n), info, verbose=False)
+        onsets = np.arange(1, n / 250 - 1, 2.5)
+        descriptions = np.resize(["769", "770", "768"], len(onsets))
+        raw.set_annotations(mne.Annotations(onsets, 0.5, descriptions))
+        raws[f"{path}B010{i}{suffix}.gdf"] = raw
+    return raws
+
+
+@pytest.mark.parametrize(
+    "load, suffix, sessions",
+    [
+        ("train", "T", [(1, 3000), (2, 4500), (3, 2000)]),
+        ("test", "E", [(4, 2500), (5, 3500)]),
+    ],
+)
+def test_load_c4_ds2b(tmp_path, monkeypatch, load, suffix, sessions):
+    path = str(tmp_path) + "/"
+    raws = _make_sessions(path, suffix, sessions)
+    for fname in raws:
+        open(fname, "w").close()
+    monkeypatch.setattr(
+        mne.io, "read_raw_gdf", lambda fname, preload=False: raws[fname].copy()
+    )
+    # what appending the sessions with mne gives
+    raw = raws[f"{path}B010{sessions[0][0]}{suffix}.gdf"].copy()
+    raw.append([r.copy() for r in list(raws.values())[1:]])
+    annotation = create_annotation(raw)
+    data = raw.pick_types(eeg=True).get_data().transpose()
+
+    for cache in [False, True, True]:
+        fs, data2, annotation2 = load_c4_ds2b(path, "01", load, n_jobs=2, cache=cache)
+        assert fs == 250
+        assert data2.flags["C_CONTIGUOUS"]
+        assert np.array_equal(data2, data)
+        pd.testing.assert_frame_equal(annotation2, annotation)
+    assert isinstance(data2, np.memmap)
+
+    _, _, events = load_c4_ds2b(path, "01", load, as_event_table=True)
+    assert np.array_equal(events.onset, EventTable.from_mne(raw).onset)
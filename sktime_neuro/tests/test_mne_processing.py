@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import mne
+import numpy as np
+import pandas as pd
+import pytest
+from sktime_neuro.utils.mne_processing import create_annotation, create_mne_raw
+
+
+def _make_raw(n_events=50, sfreq=250):
+    np.random.seed(42)
+    info = mne.create_info(ch_names=["C3", "Cz", "C4"], ch_types="eeg", sfreq=sfreq)
+    raw = mne.io.RawArray(np.random.randn(3, 100 * sfreq), info, verbose=False)
+    onsets = np.sort(np.random.uniform(0, 99, n_events))
+    descriptions = np.random.choice(["left", "right", "rest"], n_events)
+    raw.set_annotations(mne.Annotations(onsets, 0.5, descriptions))
+    return raw
+
+
+@pytest.mark.parametrize("categorical", [True, False])
+def test_create_annotation(categorical):
+    raw = _make_raw()
+    annotation = create_annotation(raw, categorical=categorical)
+    assert list(annotation.columns) == ["onset", "duration", "description"]
+    assert len(annotation) == len(raw.annotations)
+    for idx, event in enumerate(raw.annotations):
+        assert annotation["onset"][idx] == event["onset"]
+        assert annotation["duration"][idx] == event["duration"]
+        assert annotation["description"][idx] == event["description"]
+    assert (annotation["description"].dtype == "category") == categorical
+
+
+def test_create_annotation_sample_index():
+    raw = _make_raw()
+    annotation = create_annotation(raw, sample_index=True)
+    assert np.array_equal(
+        annotation["onset_sample"], [int(250 * o) for o in raw.annotations.onset]
+    )
+    assert (annotation["duration_sample"] == 125).all()
+
+
+def test_create_mne_raw_no_copy():
+    data = np.random.randn(3, 1000)
+    raw = create_mne_raw(data, 250, ch_names=["C3", "Cz", "C4"])
+    assert np.shares_memory(raw._data, data)
+    assert raw.info["highpass"] == 1
+    assert raw.ch_names == ["C3", "Cz", "C4"]
+    # the info is shared between calls with the same layout, but not modified
+    raw2 = create_mne_raw(data, 250, ch_names=["C3", "Cz", "C4"])
+    raw2.info["bads"] = ["C3"]
+    assert raw.info["bads"] == []
+
+
+def test_create_mne_raw_dataframe():
+    df = pd.DataFrame(np.random.randn(1000, 3), columns=["C3", "Cz", "C4"])
+    raw = create_mne_raw(df, 250)
+    assert raw.get_data().shape == (3, 1000)
+    assert np.array_equal(raw.get_data(), df.to_numpy().T)
+    raw = create_mne_raw(df, 250, ch_names=["C4", "C3"])
+    assert np.array_equal(raw.get_data(), df[["C4", "C3"]].to_numpy().T)
+    raw = create_mne_raw(df["Cz"], 250)
+    assert np.array_equal(raw.get_data()[0], df["Cz"])
+    assert raw.ch_names == ["Cz"]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from sktime.utils.sampling import stratified_resample as sktime_resample
+
+from sktime_neuro.benchmarking.resampling import (
+    StratifiedResampler,
+    stratified_resample,
+)
+
+
+def _make_panel(n_cases, seed):
+    rng = np.random.RandomState(seed)
+    X = rng.randn(n_cases, 2, 20)
+    y = rng.choice(["a", "b", "c"], n_cases)
+    return X, y
+
+
+def _nested(X):
+    return pd.DataFrame(
+        [[pd.Series(channel) for channel in case] for case in X],
+        columns=["dim_0", "dim_1"],
+    )
+
+
+# Check that resamples are the same as the ones of sktime for the same seeds
+@pytest.mark.parametrize("random_state", [1, 2, 29])
+def test_same_as_sktime(random_state):
+    X_train, y_train = _make_panel(30, 0)
+    X_test, y_test = _make_panel(20, 1)
+    expected = sktime_resample(
+        _nested(X_train), y_train, _nested(X_test), y_test, random_state
+    )
+    resampled = stratified_resample(
+        _nested(X_train), y_train, _nested(X_test), y_test, random_state
+    )
+    for X1, X2 in [(expected[0], resampled[0]), (expected[2], resampled[2])]:
+        pd.testing.assert_frame_equal(X1, X2)
+    assert np.array_equal(expected[1], resampled[1])
+    assert np.array_equal(expected[3], resampled[3])
+
+    # numpy panels give the same cases
+    X_train2, y_train2, X_test2, y_test2 = StratifiedResampler(
+        X_train, y_train, X_test, y_test
+    ).resample(random_state)
+    assert np.array_equal(X_train2[:, 0], np.stack(expected[0]["dim_0"]))
+    assert np.array_equal(X_test2[:, 1], np.stack(expected[2]["dim_1"]))
+    assert np.array_equal(y_train2, expected[1])
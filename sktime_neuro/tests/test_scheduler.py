@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import sys
+import types
+
+import pandas as pd
+import pytest
+
+from sktime_neuro import benchmarking
+from sktime_neuro.benchmarking import scheduler
+from sktime_neuro.benchmarking.scheduler import run_classification_experiments
+
+# the stand-in experiments only reach workers that are forked from the tests
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="worker processes are not forked",
+)
+
+
+def _load_and_run(problem_path, results_path, cls_name, dataset, resample_id, **kwargs):
+    """Stand-in for load_and_run_classification_experiment."""
+    if dataset == "crash":
+        os._exit(1)
+    if dataset == "error":
+        raise ValueError("no such dataset")
+    path = f"{results_path}/{cls_name}/Predictions/{dataset}/"
+    os.makedirs(path, exist_ok=True)
+    open(f"{path}testResample{resample_id}.csv", "w").close()
+
+
+def _patch_experiments(monkeypatch):
+    experiments = types.ModuleType("sktime_neuro.benchmarking.experiments")
+    experiments.load_and_run_classification_experiment = _load_and_run
+    # the workers are forked and import the experiments from the parent
+    monkeypatch.setitem(sys.modules, experiments.__name__, experiments)
+    monkeypatch.setattr(benchmarking, "experiments", experiments, raising=False)
+
+
+def _statuses(manifest):
+    return {
+        (row.dataset, row.resample_id): row.status for row in manifest.itertuples()
+    }
+
+
+# Check that jobs are run, failures recorded and finished jobs skipped
+def test_run_classification_experiments(tmp_path, monkeypatch):
+    _patch_experiments(monkeypatch)
+    manifest = run_classification_experiments(
+        "", str(tmp_path), ["cls"], ["a", "error"], [0, 1], n_jobs=2, verbose=False
+    )
+    assert _statuses(manifest) == {
+        ("a", 0): "done",
+        ("a", 1): "done",
+        ("error", 0): "failed",
+        ("error", 1): "failed",
+    }
+    assert "no such dataset" in manifest["error"].iloc[-1]
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "manifest.csv", keep_default_na=False),
+        manifest,
+        check_dtype=False,
+    )
+
+    manifest = run_classification_experiments(
+        "", str(tmp_path), ["cls"], ["a"], [0, 1, 2], verbose=False
+    )
+    assert list(manifest["status"]) == ["skipped", "skipped", "done"]
+
+
+# Check that a dying worker does not lose the jobs that finished before
+def test_run_classification_experiments_crash(tmp_path, monkeypatch, capsys):
+    _patch_experiments(monkeypatch)
+    manifest = run_classification_experiments(
+        "", str(tmp_path), ["cls"], ["a", "crash"], [0], n_jobs=1
+    )
+    assert _statuses(manifest) == {("a", 0): "done", ("crash", 0): "failed"}
+    assert "BrokenProcessPool" in manifest["error"].iloc[-1]
+    assert (tmp_path / "manifest.csv").exists()
+    assert "[2/2]" in capsys.readouterr().out
+
+
+# Check that invalid n_jobs and unsupported pinning are rejected
+def test_run_classification_experiments_invalid(tmp_path, monkeypatch):
+    with pytest.raises(ValueError, match="n_jobs"):
+        run_classification_experiments("", str(tmp_path), ["cls"], ["a"], n_jobs=0)
+    monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+    with pytest.raises(ValueError, match="pin_cpus"):
+        run_classification_experiments("", str(tmp_path), ["cls"], ["a"], pin_cpus=True)
+
+
+# Check that negative n_jobs leave CPUs free like in joblib
+def test_run_classification_experiments_negative_n_jobs(tmp_path, monkeypatch):
+    _patch_experiments(monkeypatch)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    workers = []
+    real_executor = scheduler.ProcessPoolExecutor
+
+    def executor(max_workers, **kwargs):
+        workers.append(max_workers)
+        return real_executor(max_workers, **kwargs)
+
+    monkeypatch.setattr(scheduler, "ProcessPoolExecutor", executor)
+    for n_jobs in [-1, -2, -4, -10]:
+        run_classification_experiments(
+            "",
+            str(tmp_path),
+            ["cls"],
+            ["a"],
+            [0],
+            n_jobs=n_jobs,
+            overwrite=True,
+            verbose=False,
+        )
+    assert workers == [4, 3, 1, 1]
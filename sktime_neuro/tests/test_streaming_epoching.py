@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from sktime_neuro.transformations.series_to_panel.eeg_epoching import epoch
+from sktime_neuro.transformations.series_to_panel.streaming_epoching import (
+    StreamingEpocher,
+)
+
+
+def _make_data(sfreq=250):
+    np.random.seed(42)
+    Z = np.random.randn(40 * sfreq, 4)
+    onsets = np.arange(1, 37, 0.7)
+    annotation = pd.DataFrame(
+        {
+            "onset": onsets,
+            "duration": 0.0,
+            "description": np.resize(["left", "right", "rest"], len(onsets)),
+        }
+    )
+    return Z, annotation
+
+
+# Check that streamed trials agree with epoching the whole recording
+@pytest.mark.parametrize("n_chunks", [1, 17, 400])
+@pytest.mark.parametrize("buffer_length", [1.5, 10])
+def test_streaming_equals_offline(n_chunks, buffer_length):
+    Z, annotation = _make_data()
+    labels = ["left", "right"]
+    X1, y1 = epoch(Z, annotation, labels, (-0.5, 1), 250)
+
+    epocher = StreamingEpocher(labels, (-0.5, 1), 250, buffer_length=buffer_length)
+    epocher.fit()
+    Xs, ys = [], []
+    seen = 0
+    for chunk in np.array_split(Z, n_chunks):
+        # markers arrive once the sample at their onset was recorded
+        t_from, t_to = seen / 250, (seen + len(chunk)) / 250
+        events = annotation[(annotation.onset >= t_from) & (annotation.onset < t_to)]
+        Xt, y = epocher.update(chunk, events)
+        Xs.append(Xt)
+        ys.append(y)
+        seen += len(chunk)
+    assert np.array_equal(np.concatenate(Xs), X1)
+    assert np.array_equal(np.concatenate(ys), y1)
+
+
+# Check that markers arriving too late are dropped
+def test_late_events_are_dropped():
+    Z, annotation = _make_data()
+    epocher = StreamingEpocher(["left"], (0, 1), 250, buffer_length=2).fit()
+    epocher.update(Z)
+    with pytest.warns(UserWarning):
+        Xt, y = epocher.update(Z[:10], annotation)
+    assert len(Xt) == len(y) == 0
+
+
+def test_buffer_too_short():
+    with pytest.raises(ValueError):
+        StreamingEpocher(["left"], (-1, 1), 250, buffer_length=1)
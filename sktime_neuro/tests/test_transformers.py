@@ -1,4 +1,79 @@
 # -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sktime_neuro.transformations.panel.baselinecorrection import (
+    BaselineCorrectionTransformer,
+)
+from sktime_neuro.transformations.panel.filterforpanel import FilterforPanel
+from sktime_neuro.transformations.panel.paneldownsampling import PanelDownsampling
+from sktime_neuro.transformations.panel.timeslicing import TimeSlicingTransformer
+
 
 def test_transformer():
-    print("Up the Arsenal")
\ No newline at end of file
+    print("Up the Arsenal")
+
+
+panel_transformers = [
+    FilterforPanel(sfreq=250, l_freq=1, h_freq=30),
+    BaselineCorrectionTransformer(lower=0, upper=0.5, fs=250),
+    TimeSlicingTransformer(start=0.5, end=1.5, fs=250),
+    PanelDownsampling(factor=3),
+]
+
+
+# Check that chunked and parallel execution agrees with a single transform
+@pytest.mark.parametrize("transformer", panel_transformers)
+@pytest.mark.parametrize(
+    "chunk_size, n_jobs, backend",
+    [(7, 1, "threading"), (None, 2, "threading"), (None, 2, "loky")],
+)
+def test_transform_in_chunks(transformer, chunk_size, n_jobs, backend):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(30, 4, 500)
+    transformer.fit(X)
+    Xt1 = transformer.transform(X)
+    Xt2 = transformer.transform_in_chunks(
+        X, chunk_size=chunk_size, n_jobs=n_jobs, backend=backend
+    )
+    assert np.allclose(Xt1, Xt2)
+
+
+# Check that a chain of transformers can run on memory mapped files
+@pytest.mark.parametrize("backend", ["threading", "loky"])
+def test_transform_in_chunks_memmap(tmp_path, backend):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(30, 4, 500)
+    np.save(tmp_path / "X.npy", X)
+
+    Xt1 = X
+    Xt2 = np.load(tmp_path / "X.npy", mmap_mode="r")
+    for i, transformer in enumerate(panel_transformers):
+        transformer.fit(Xt1)
+        Xt1 = transformer.transform(Xt1)
+        Xt2 = transformer.transform_in_chunks(
+            Xt2,
+            chunk_size=4,
+            n_jobs=2,
+            backend=backend,
+            out=tmp_path / f"Xt{i}.npy",
+        )
+        assert isinstance(Xt2, np.memmap)
+    assert np.allclose(Xt1, np.load(tmp_path / f"Xt{i}.npy"))
+
+
+# Check that an in-memory out is filled with every backend
+@pytest.mark.parametrize("backend", ["threading", "loky"])
+def test_transform_in_chunks_array_out(backend):
+    np.random.seed(42)
+    X = 0.02 * np.random.randn(30, 4, 500)
+    transformer = TimeSlicingTransformer(start=0, end=50, fs=1).fit(X)
+    out = np.full((30, 4, 50), np.nan)
+    Xt = transformer.transform_in_chunks(X, n_jobs=4, backend=backend, out=out)
+    assert Xt is out
+    assert np.allclose(out, transformer.transform(X))
+
+    # large enough to be passed to the processes as read-only memory map
+    X = 0.02 * np.random.randn(30, 4, 5000)
+    out = np.full((30, 4, 50), np.nan)
+    transformer.transform_in_chunks(X, n_jobs=4, backend=backend, out=out)
+    assert np.allclose(out, transformer.transform(X))
@@ -7,14 +7,18 @@ __all__ = [
     "_SeriesToSeriesTransformer",
     "_PanelToTabularTransformer",
     "_PanelToPanelTransformer",
+    "_SeriesToPanelTransformer",
 ]
 
+import os
 from typing import Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 
 from sktime.base import BaseEstimator
+from sktime.utils.validation.panel import check_X
 
 # single/multiple primitives
 Primitive = Union[np.integer, int, np.float, float, str]
@@ -124,9 +128,100 @@ class _PanelToPanelTransformer(BaseTransformer):
     def transform(self, X: Panel, y=None) -> Panel:
         raise NotImplementedError("abstract method")
 
+    def transform_in_chunks(
+        self,
+        X: Panel,
+        y=None,
+        chunk_size=None,
+        n_jobs=1,
+        backend="threading",
+        out=None,
+    ) -> np.ndarray:
+        """Transform X in chunks of trials, optionally in parallel.
+
+        Only valid for transformers that treat every trial independently.
+        X can be a memory mapped array (e.g. ``np.load(path, mmap_mode="r")``)
+        and together with out, only one chunk at a time needs to fit in memory.
 
-# class _SeriesToPanelTransformer(BaseTransformer):
-#   """Transformer base class for series to panel transforms"""
+        Parameters
+        ----------
+        X : pd.DataFrame, np.array or np.memmap
+            shape: trials*channels*timepoints
+        y : ignored
+        chunk_size : int or None (default None)
+            number of trials per chunk, if None X is split
+            into one chunk per job
+        n_jobs : int (default 1)
+            number of jobs to run in parallel, -1 uses all processors
+        backend : str (default "threading")
+            joblib backend, "threading" for threads or "loky" for
+            processes. Processes get X as a memory map instead of a
+            pickled copy.
+        out : str, os.PathLike, np.array or None (default None)
+            where to write the transformed chunks to. A path creates a
+            memory mapped .npy file, an array (e.g. a np.memmap) needs to
+            have the shape of the output. If None the chunks are
+            concatenated in memory. Processes can only write to a path or
+            a np.memmap, other arrays are filled by the parent process from
+            the returned chunks.
 
-#    def transform(self, Z: Series, y=None) -> Panel:
-#        raise NotImplementedError("abstract method")
+        Returns
+        -------
+        Xt : np.array or np.memmap
+            transformed panel, out if it was given
+        """
+        self.check_is_fitted()
+        X = check_X(X, coerce_to_numpy=True)
+        n_trials = X.shape[0]
+        if chunk_size is None:
+            chunk_size = max(-(-n_trials // effective_n_jobs(n_jobs)), 1)
+        bounds = [
+            (start, min(start + chunk_size, n_trials))
+            for start in range(0, n_trials, chunk_size)
+        ]
+
+        if out is not None:
+            # a single trial determines shape and type of the output
+            probe = self.transform(X[:1])
+            shape = (n_trials,) + probe.shape[1:]
+            if isinstance(out, (str, os.PathLike)):
+                out = np.lib.format.open_memmap(
+                    out, mode="w+", dtype=probe.dtype, shape=shape
+                )
+            elif out.shape != shape:
+                raise ValueError(f"out needs to be of shape {shape}")
+
+        # processes get a pickled or read-only copy of an in-memory array,
+        # so only threads and memory mapped files can be written by the jobs
+        shared = out is not None and (
+            backend == "threading" or isinstance(out, np.memmap)
+        )
+        # every job gets all of X and slices its chunk itself,
+        # so X is only memory mapped once for process backends
+        Xts = Parallel(n_jobs=n_jobs, backend=backend, max_nbytes="1M")(
+            delayed(_transform_chunk)(self, X, start, stop, out if shared else None)
+            for start, stop in bounds
+        )
+        if out is None:
+            return np.concatenate(Xts)
+        if not shared:
+            for (start, stop), Xt in zip(bounds, Xts):
+                out[start:stop] = Xt
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+
+def _transform_chunk(transformer, X, start, stop, out=None):
+    """Transform the trials start to stop of X and write them to out."""
+    Xt = transformer.transform(X[start:stop])
+    if out is None:
+        return Xt
+    out[start:stop] = Xt
+
+
+class _SeriesToPanelTransformer(BaseTransformer):
+    """Transformer base class for series to panel transforms"""
+
+    def transform(self, Z: Series, X=None) -> Panel:
+        raise NotImplementedError("abstract method")
@@ -20,17 +20,27 @@ class BaselineCorrectionTransformer(_PanelToPanelTransformer):
             upper limit of baseline segment
     fs : int or float
         sampling frequency of the recorded data in Hz
+    method : str, "mean", "median" or "zscore" (default "mean")
+        "mean" and "median" subtract the mean or median of the baseline,
+        "zscore" subtracts the mean and divides by the standard deviation
+        of the baseline
+    copy : bool (default True)
+        if False, floating point input is corrected in place
 
     If start and end are None the trial gets normalized: average is calculated
     over entire trial per channel and subtracted from each timepoint in that
     channel.
     """
 
-    def __init__(self, lower=None, upper=None, fs=2):
+    def __init__(self, lower=None, upper=None, fs=2, method="mean", copy=True):
         self.lower = lower
         self.upper = upper
         self.fs = fs
-        super(BaselineCorrectionTransformer).__init__()
+        self.method = method
+        self.copy = copy
+        if method not in ("mean", "median", "zscore"):
+            raise ValueError("method must be one of 'mean', 'median' or 'zscore'")
+        super(BaselineCorrectionTransformer, self).__init__()
 
     def transform(self, X, y=None) -> np.array:
         """
@@ -47,6 +57,37 @@ class BaselineCorrectionTransformer(_PanelToPanelTransformer):
         Xt : np.array
              baseline corrected panel data
         """
+        self.check_is_fitted()
+        X = check_X(X, coerce_to_numpy=True)
+        lower_index, upper_index = self._get_indices(X.shape[2])
+
+        # apply baseline correction, statistics have shape trial*channel*1
+        # so that they broadcast over the timepoints
+        baseline = X[:, :, lower_index:upper_index]
+        if self.method == "median":
+            center = np.median(baseline, axis=2, keepdims=True)
+        else:
+            center = np.mean(baseline, axis=2, keepdims=True)
+        if self.method == "zscore":
+            scale = np.std(baseline, axis=2, keepdims=True)
+
+        # floating point types are kept, everything else becomes float64
+        if np.issubdtype(X.dtype, np.floating):
+            dtype = X.dtype
+        else:
+            dtype = np.float64
+        if self.copy or X.dtype != dtype or not X.flags.writeable:
+            Xt = np.array(X, dtype=dtype)
+        else:
+            Xt = X
+        Xt -= center
+        if self.method == "zscore":
+            Xt /= scale
+
+        return Xt
+
+    def _get_indices(self, n_timepoints):
+        """Check the parameters and return the baseline bounds as indices."""
         if not (
             isinstance(self.lower, (int, float, type(None)))
             & isinstance(self.upper, (int, float, type(None)))
@@ -55,41 +96,22 @@ class BaselineCorrectionTransformer(_PanelToPanelTransformer):
             raise TypeError(
                 "start and end need to be numbers or none;" "fs needs to be a number."
             )
-        self.check_is_fitted()
-        X = check_X(X, coerce_to_numpy=True)
 
         # check if boundaries make sense
         if self.lower is not None:
             lower_index = int(self.lower * self.fs)
-            if not (0 <= lower_index < X.shape[2]):
+            if not (0 <= lower_index < n_timepoints):
                 raise ValueError("Lower limit is invalid, unit is seconds")
         else:
             lower_index = 0
 
         if self.upper is not None:
             upper_index = int(self.upper * self.fs)
-            if not (0 <= upper_index < X.shape[2]):
+            if not (0 <= upper_index < n_timepoints):
                 raise ValueError("Upper limit is invalid, unit is seconds")
         else:
-            upper_index = X.shape[2]
+            upper_index = n_timepoints
         if self.lower is not None and self.upper is not None:
             if not (self.lower < self.upper):
                 raise ValueError("Lower limit must be lower than upper limit")
-
-        # apply baseline correction
-        Xt = np.zeros(X.shape)  # shape: trial*channel*timepoints
-        baseline_means = np.mean(
-            X[:, :, lower_index:upper_index], axis=2
-        )  # shape trial*channel
-
-        # for subtraction trailing axes need to be the same
-        Xt = np.transpose(X, (2, 0, 1)) - baseline_means
-        Xt = np.transpose(Xt, (1, 2, 0))
-
-        # what the section above does in verbose
-        # for trial in range(X.shape[0]):
-        #   for channel in range(X.shape[1]):
-        #       Xt[trial, channel, :] = X[trial,channel, :] -
-        #       np.mean(X[trial, channel, self.lower:self.upper])
-
-        return Xt
+        return lower_index, upper_index
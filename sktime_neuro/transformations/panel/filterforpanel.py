@@ -5,7 +5,11 @@ __all__ = ["FilterforPanel"]
 
 from sktime_neuro.transformations.base import _PanelToPanelTransformer
 from sktime.utils.validation.panel import check_X
-from mne import filter
+from sktime_neuro.utils.filter_design import (
+    apply_filter,
+    apply_filter_batched,
+    design_filter,
+)
 import numpy as np
 
 _required_parameter = ["sfreq", "l_freq", "h_freq"]
@@ -28,10 +32,20 @@ class FilterforPanel(_PanelToPanelTransformer):
         For FIR filters, the upper pass-band edge;
         for IIR filters, the upper cutoff frequency.
         If None the data are only high-passed.
+    backend : str, "mne" or "batched" (default "mne")
+        "mne" filters one row after the other like ``mne.filter.filter_data``,
+        "batched" reshapes the panel to (trials*channels, timepoints) and
+        filters all rows in one vectorized FFT convolution (FIR) or
+        ``sosfiltfilt`` (IIR) call. Does not support picks and n_jobs.
+    dtype : str, "float64" or "float32" (default "float64")
+        precision of the filtering, float32 requires the batched backend
     **kwargs
         Additional parameters passed on to ``mne.filter.filter_data``.
         See ``mne.filter.filter_data``
         documentation for a detailed description of all options.
+
+    The filter is designed once in ``fit``. Designed filters are cached
+    across instances, see ``sktime_neuro.utils.filter_design``.
     """
 
     def __init__(
@@ -39,11 +53,15 @@ class FilterforPanel(_PanelToPanelTransformer):
         sfreq,
         l_freq,
         h_freq,
+        backend="mne",
+        dtype="float64",
         **kwargs,
     ):
         self.sfreq = sfreq
         self.l_freq = l_freq
         self.h_freq = h_freq
+        self.backend = backend
+        self.dtype = dtype
         self.kwargs = kwargs
         if not (
             isinstance(sfreq, (int, float))
@@ -56,9 +74,33 @@ class FilterforPanel(_PanelToPanelTransformer):
                 raise ValueError("Negative values not supported")
             if l_freq > h_freq:
                 raise ValueError("High frequency must be higher /" "than low frequency")
+        if backend not in ("mne", "batched"):
+            raise ValueError("backend must be either 'mne' or 'batched'")
+        if dtype not in ("float64", "float32"):
+            raise ValueError("dtype must be either 'float64' or 'float32'")
+        if backend == "mne" and dtype != "float64":
+            raise ValueError("The mne backend only filters in float64")
         super(FilterforPanel, self).__init__()
 
-    def transform(self, Z, x=None) -> np.array:
+    def fit(self, Z, X=None):
+        """Design the filter.
+
+        Parameters
+        ----------
+        Z : pd.Series/np.array
+        X : ignored
+
+        Returns
+        -------
+        self : a fitted instance of the estimator
+        """
+        self.filter_ = design_filter(
+            self.sfreq, self.l_freq, self.h_freq, **self.kwargs
+        )
+        self._is_fitted = True
+        return self
+
+    def transform(self, Z, x=None, out=None) -> np.array:
         """Transform data.
         Returns a transformed version of Z.
 
@@ -66,6 +108,9 @@ class FilterforPanel(_PanelToPanelTransformer):
         ----------
         Z : pd.Series/np.array
             shape needs to have timepoints as last dimension
+        out : np.array or None (default None)
+            array of the shape of Z and type dtype to write the result to,
+            only supported by the batched backend
 
         Returns
         -------
@@ -75,8 +120,13 @@ class FilterforPanel(_PanelToPanelTransformer):
 
         self.check_is_fitted()
         Z = check_X(Z, coerce_to_numpy=True)
-        z = filter.filter_data(
-            Z, sfreq=self.sfreq, l_freq=self.l_freq, h_freq=self.h_freq, **self.kwargs
-        )
+        if self.backend == "batched":
+            z = apply_filter_batched(
+                Z, self.filter_, dtype=self.dtype, out=out, **self.kwargs
+            )
+        else:
+            if out is not None:
+                raise ValueError("out is only supported by the batched backend")
+            z = apply_filter(Z, self.filter_, **self.kwargs)
 
         return z
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+__all__ = ["FusedPanelPipeline"]
+
+import numpy as np
+from sktime.utils.validation.panel import check_X
+
+from sktime_neuro.transformations.base import _PanelToPanelTransformer
+from sktime_neuro.transformations.panel.baselinecorrection import (
+    BaselineCorrectionTransformer,
+)
+from sktime_neuro.transformations.panel.paneldownsampling import PanelDownsampling
+from sktime_neuro.transformations.panel.timeslicing import TimeSlicingTransformer
+
+_fusable = (TimeSlicingTransformer, BaselineCorrectionTransformer, PanelDownsampling)
+
+
+class FusedPanelPipeline(_PanelToPanelTransformer):
+    """Apply a sequence of panel transformers, fusing neighbouring index steps.
+
+    Consecutive ``TimeSlicingTransformer``, ``BaselineCorrectionTransformer``
+    and ``PanelDownsampling`` steps are compiled into a single pass: the
+    slices and downsampling factors are combined into one strided index
+    range of the input, and only the last baseline correction of such a run
+    changes the result, since subtracting a constant per trial and channel
+    is undone by any later baseline correction. The input is validated
+    once, the selected timepoints are copied once (or not at all without
+    baseline correction) and the baseline is subtracted in place.
+    Other transformers, as well as baseline corrections with
+    method="zscore" and polyphase downsampling, which filter or rescale
+    the data, are applied as they are between the fused runs.
+
+    The result is the same as applying the steps one after the other.
+
+    Parameters
+    ----------
+    steps : list of transformers
+        panel transformers to apply in the given order
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        super(FusedPanelPipeline, self).__init__()
+
+    def fit(self, X, y=None):
+        """Fit every step on the output of the steps before it.
+
+        Parameters
+        ----------
+        X : pd.DataFrame or np.array
+            shape: trials*channels*timepoints
+        y : ignored
+
+        Returns
+        -------
+        self : a fitted instance of the estimator
+        """
+        Xt = check_X(X, coerce_to_numpy=True)
+        segments = self._compile()
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if isinstance(segment, list):
+                for step in segment:
+                    step.fit(Xt)
+                if not last:
+                    Xt = _fused_transform(segment, Xt)
+            else:
+                segment.fit(Xt)
+                if not last:
+                    Xt = segment.transform(Xt)
+        self._segments = segments
+        self._is_fitted = True
+        return self
+
+    def transform(self, X, y=None) -> np.array:
+        """
+        Transform X with all steps.
+
+        Parameters
+        ----------
+        X : pd.DataFrame or np.array
+            shape: trials*channels*timepoints
+
+        Returns
+        -------
+        Xt : np.array
+            transformed panel data
+        """
+        self.check_is_fitted()
+        Xt = check_X(X, coerce_to_numpy=True)
+        for segment in self._segments:
+            if isinstance(segment, list):
+                Xt = _fused_transform(segment, Xt)
+            else:
+                Xt = segment.transform(Xt)
+        return Xt
+
+    def _compile(self):
+        """Group consecutive fusable steps into lists."""
+        segments = []
+        for step in self.steps:
+            if not _is_fusable(step):
+                segments.append(step)
+            elif segments and isinstance(segments[-1], list):
+                segments[-1].append(step)
+            else:
+                segments.append([step])
+        return segments
+
+
+def _is_fusable(step):
+    """Check whether step only selects timepoints or subtracts a baseline."""
+    if isinstance(step, BaselineCorrectionTransformer):
+        return step.method != "zscore"
+    if isinstance(step, PanelDownsampling):
+        return step.method == "decimate"
+    return isinstance(step, _fusable)
+
+
+def _fused_transform(steps, X):
+    """Apply fusable steps to X in a single pass.
+
+    The current timepoints of the data are tracked as the range
+    X[..., offset : offset + length * step : step] of the input.
+    """
+    offset, length, step = 0, X.shape[2], 1
+    baseline = None
+    for transformer in steps:
+        if isinstance(transformer, TimeSlicingTransformer):
+            lower, upper = transformer._get_indices(length)
+            offset, length = offset + lower * step, upper - lower
+        elif isinstance(transformer, PanelDownsampling):
+            transformer._check_factor(length)
+            length = -(-length // transformer.factor)
+            step = step * transformer.factor
+        else:
+            lower, upper = transformer._get_indices(length)
+            baseline = (offset + lower * step, offset + upper * step, step)
+            method = transformer.method
+
+    Xt = X[:, :, offset : offset + length * step : step]
+    if baseline is None:
+        return Xt
+    start, stop, baseline_step = baseline
+    baseline = X[:, :, start:stop:baseline_step]
+    if method == "median":
+        center = np.median(baseline, axis=2, keepdims=True)
+    else:
+        center = np.mean(baseline, axis=2, keepdims=True)
+    dtype = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+    Xt = np.array(Xt, dtype=dtype)
+    Xt -= center
+    return Xt
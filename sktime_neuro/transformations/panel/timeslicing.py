@@ -40,6 +40,15 @@ class TimeSlicingTransformer(_PanelToPanelTransformer):
         Xt : np.array
             truncated time series
         """
+        self.check_is_fitted()
+        X = check_X(X, coerce_to_numpy=True)
+        lower_index, upper_index = self._get_indices(X.shape[2])
+
+        Xt = X[:, :, lower_index:upper_index]
+        return Xt
+
+    def _get_indices(self, n_timepoints):
+        """Check the parameters and return the slice bounds as indices."""
         if not (
             isinstance(self.start, (int, float, type(None)))
             & isinstance(self.end, (int, float, type(None)))
@@ -49,26 +58,21 @@ class TimeSlicingTransformer(_PanelToPanelTransformer):
                 "start and end need to be numbers or none;" "fs needs to be a number."
             )
 
-        self.check_is_fitted()
-        X = check_X(X, coerce_to_numpy=True)
-
         # check if boundaries make sense
         if self.start is not None:
             lower_index = int(self.start * self.fs)
-            if not (0 <= lower_index < X.shape[2]):
+            if not (0 <= lower_index < n_timepoints):
                 raise ValueError("Lower limit is invalid, unit is seconds")
         else:
             lower_index = 0
 
         if self.end is not None:
             upper_index = int(self.end * self.fs)
-            if not (0 <= upper_index < X.shape[2]):
+            if not (0 <= upper_index < n_timepoints):
                 raise ValueError("Upper limit is invalid, unit is seconds")
         else:
-            upper_index = X.shape[2]
+            upper_index = n_timepoints
         if self.start is not None and self.end is not None:
             if not (self.start < self.end):
                 raise ValueError("Lower limit must be lower than upper limit")
-
-        Xt = X[:, :, lower_index:upper_index]
-        return Xt
+        return lower_index, upper_index
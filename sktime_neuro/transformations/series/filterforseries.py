@@ -4,8 +4,9 @@ __all__ = ["FilterforSeries"]
 
 import pandas as pd
 from sktime_neuro.transformations.base import _SeriesToSeriesTransformer
-from mne import filter
+from scipy import signal
 from sktime.utils.validation.series import check_series
+from sktime_neuro.utils.filter_design import apply_filter, design_filter, is_causal
 import numpy as np
 
 _required_parameter = ["sfreq", "l_freq", "h_freq"]
@@ -32,6 +33,19 @@ class FilterforSeries(_SeriesToSeriesTransformer):
         Additional parameters passed on to ``mne.filter.filter_data``.
         See ``mne.filter.filter_data``
         documentation for a detailed description of all options.
+
+    Streams can be filtered chunk by chunk with ``update``. This requires a
+    causal filter, i.e. ``phase="minimum"`` for FIR or ``phase="forward"``
+    for IIR filters. The filter is designed once in ``fit``, and the filter
+    state (overlap-save tail for FIR, ``zi`` for IIR) is kept between calls,
+    so the concatenated output is identical to filtering the whole stream in
+    one causal pass, while memory stays constant. The stream is assumed to be
+    zero before its first sample. ``transform`` of a FIR filter pads the edges
+    like mne, with ``pad="reflect_limited"`` by default, so the first
+    ``len(filter_) - 1`` samples of ``update`` and ``transform`` differ unless
+    ``pad="constant"`` is given; the rest, and all samples of a forward IIR
+    filter, are the same. Designed filters are cached across instances, see
+    ``sktime_neuro.utils.filter_design``.
     """
 
     def __init__(
@@ -58,6 +72,25 @@ class FilterforSeries(_SeriesToSeriesTransformer):
                 raise ValueError("High frequency must be higher" " than low frequency")
         super(FilterforSeries, self).__init__()
 
+    def fit(self, Z, X=None):
+        """Design the filter and reset the filter state of the stream.
+
+        Parameters
+        ----------
+        Z : 2D numpy array, pd.Series or pd.DataFrame
+        X : ignored
+
+        Returns
+        -------
+        self : a fitted instance of the estimator
+        """
+        self.filter_ = design_filter(
+            self.sfreq, self.l_freq, self.h_freq, **self.kwargs
+        )
+        self._state = None
+        self._is_fitted = True
+        return self
+
     def transform(self, Z, x=None) -> np.array:
         """Transform data.
         Returns a transformed version of Z.
@@ -84,10 +117,63 @@ class FilterforSeries(_SeriesToSeriesTransformer):
         z = z.transpose()
 
         # z is now of shape channels * timepoints
-        z = filter.filter_data(
-            z, sfreq=self.sfreq, l_freq=self.l_freq, h_freq=self.h_freq, **self.kwargs
-        )
+        z = apply_filter(z, self.filter_, **self.kwargs)
 
         # transpose back to have sktime shape again (timepoints*channels)
         z = z.transpose()
         return z
+
+    def update(self, Z, X=None):
+        """Filter the next chunk of a stream.
+
+        Parameters
+        ----------
+        Z : 2D numpy array, pd.Series or pd.DataFrame
+        (will get coerced to numpy); needs to be of
+        shape timepoints*channels
+
+        Returns
+        -------
+        z : 2D numpy array
+            Filtered chunk.
+        """
+        self.check_is_fitted()
+        if not is_causal(**self.kwargs):
+            raise ValueError(
+                "Only causal filters can be applied chunk by chunk, "
+                'use phase="minimum" for FIR or phase="forward" for IIR filters.'
+            )
+        z = check_series(Z, allow_numpy=True)
+        if isinstance(z, (pd.DataFrame, pd.Series)):
+            z = z.to_numpy()
+        if z.ndim == 1:
+            z = z.reshape(-1, 1)
+
+        if isinstance(self.filter_, dict):
+            z = self._update_iir(z)
+        else:
+            z = self._update_fir(z)
+        return z
+
+    def _update_fir(self, z):
+        """Overlap-save: prepend the last len(h) - 1 samples of the stream."""
+        h = self.filter_
+        if self._state is None:
+            self._state = np.zeros((len(h) - 1, z.shape[1]))
+        extended = np.concatenate([self._state, z])
+        self._state = extended[len(extended) - (len(h) - 1) :]
+        return signal.fftconvolve(extended, h[:, np.newaxis], mode="valid", axes=0)
+
+    def _update_iir(self, z):
+        """Run lfilter or sosfilt starting from the final state of the last chunk."""
+        if "sos" in self.filter_:
+            sos = self.filter_["sos"]
+            if self._state is None:
+                self._state = np.zeros((sos.shape[0], 2, z.shape[1]))
+            z, self._state = signal.sosfilt(sos, z, axis=0, zi=self._state)
+        else:
+            b, a = self.filter_["b"], self.filter_["a"]
+            if self._state is None:
+                self._state = np.zeros((max(len(a), len(b)) - 1, z.shape[1]))
+            z, self._state = signal.lfilter(b, a, z, axis=0, zi=self._state)
+        return z
@@ -3,7 +3,9 @@ __author__ = ["Svea Meyer"]
 __all__ = ["SeriesDownsampling"]
 
 from sktime_neuro.transformations.base import _SeriesToSeriesTransformer
+from sktime_neuro.utils.filter_design import resampling_factors
 from sktime.utils.validation.series import check_series
+from scipy import signal
 import numpy as np
 import pandas as pd
 
@@ -16,21 +18,63 @@ class SeriesDownsampling(_SeriesToSeriesTransformer):
     _________
     factor : int
         downsampling factor
-    fs : int or float
-        sampling frequency of the recorded data in Hz
+    fs : int, float or None (default None)
+        sampling frequency of the recorded data in Hz,
+        required for target_fs
+    method : str, "decimate" or "polyphase" (default "decimate")
+        "decimate" keeps every factorth timepoint,
+        "polyphase" low-passes and resamples in one pass
+        with ``scipy.signal.resample_poly``
+    target_fs : int, float or None (default None)
+        only used by the polyphase method, sampling frequency to
+        resample to in Hz, does not need to divide fs.
+        If None, the data is downsampled by factor.
 
     Downsampling keeps only the data in position
     of a multiple of factor.
     So downsampling by a factor 1 keeps all the data,
     downsampling by 2 keeps half the data, etc.
+    The polyphase method applies an anti-aliasing filter first, the
+    resulting sampling frequency is stored in ``fs_`` after fit.
     """
 
-    def __init__(self, factor=2):
+    def __init__(self, factor=2, fs=None, method="decimate", target_fs=None):
         self.factor = factor
+        self.fs = fs
+        self.method = method
+        self.target_fs = target_fs
         if not isinstance(self.factor, int):
             raise TypeError("Can only downsample by whole integers")
+        if method not in ("decimate", "polyphase"):
+            raise ValueError("method must be either 'decimate' or 'polyphase'")
+        if target_fs is not None:
+            if method != "polyphase":
+                raise ValueError("target_fs requires the polyphase method")
+            if fs is None:
+                raise ValueError("target_fs requires fs")
         super(SeriesDownsampling, self).__init__()
 
+    def fit(self, Z, X=None):
+        """
+        Compute the resampling factors and the new sampling frequency.
+
+        Parameters
+        _________
+        Z : np.array
+            shape: timepoints*channels
+
+        Returns
+        ________
+        self : a fitted instance of the estimator
+        """
+        if self.target_fs is None:
+            self.up_, self.down_ = 1, self.factor
+        else:
+            self.up_, self.down_ = resampling_factors(self.fs, self.target_fs)
+        self.fs_ = None if self.fs is None else self.fs * self.up_ / self.down_
+        self._is_fitted = True
+        return self
+
     def transform(self, Z, y=None) -> np.array:
         """
         Take every factorth element of a trial.
@@ -50,14 +94,15 @@ class SeriesDownsampling(_SeriesToSeriesTransformer):
         self.check_is_fitted()
         z = check_series(Z)
 
-        if self.factor > Z.shape[1]:
+        if self.factor > Z.shape[0]:
             raise ValueError("Factor too high for shape of Series.")
 
         # deals with numpy arrays:
         if isinstance(z, (pd.DataFrame, pd.Series)):
             z = z.to_numpy()
 
+        if self.method == "polyphase":
+            return signal.resample_poly(z, self.up_, self.down_, axis=0)
+
         z = z[0 :: self.factor, :]
-        # do we need a warning about this?
-        # print("The new sampling frequency is:" + str(self.fs / self.factor))
         return z
@@ -2,27 +2,43 @@
 __author__ = ["Svea Marie Meyer"]
 
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from sktime.utils.validation.series import check_series
 
+from sktime_neuro.utils.event_table import EventTable
 
-def epoch(Z, annotation, labels, interval, sfreq) -> (np.array, np.array):
+
+def epoch(
+    Z, annotation, labels, interval, sfreq, method="vectorized", copy=True
+) -> (np.array, np.array):
     """
     Parameters
     _________
     Z : np.array
         time series to be epoched
         shape: timepoints*channels
-    annotation : pd.DataFrame,
+    annotation : pd.DataFrame or EventTable,
         one row per event with columns "onset", "duration"
         and "descritption"
         can be create from mne raw object
         with `sktime_neuro.utils.mne_processing.create_annotation`
+        or `sktime_neuro.utils.event_table.EventTable.from_mne`,
+        an EventTable is only supported by the vectorized method
     labels : list of string
         labels of events to create trials from
     interval : tuple of float or int
         time interval around event to select
     fs : int or float
         sampling frequency of the recorded data in Hz
+    method : str, "vectorized" or "loop" (default "vectorized")
+        "vectorized" computes all onset indices at once and gathers the
+        trials from a strided window view of Z,
+        "loop" copies one trial at a time
+    copy : bool (default True)
+        only used by the vectorized method. If False and the selected
+        events are evenly spaced, a read-only view into Z is returned
+        instead of a copy; otherwise the trials are gathered into a
+        new C-contiguous float64 array, like the loop returns.
 
     Returns
     ________
@@ -34,6 +50,13 @@ def epoch(Z, annotation, labels, interval, sfreq) -> (np.array, np.array):
 
     Z = check_series(Z)
 
+    if method == "vectorized":
+        return _epoch_vectorized(Z, annotation, labels, interval, sfreq, copy)
+    elif method != "loop":
+        raise ValueError("method must be either 'vectorized' or 'loop'")
+    if isinstance(annotation, EventTable):
+        raise ValueError("The loop method requires annotation as pd.DataFrame")
+
     # create shape of final data
     n_channels = Z.shape[1]
     n_timepoints = int(interval[1] * sfreq) - int(interval[0] * sfreq)
@@ -62,3 +85,64 @@ def epoch(Z, annotation, labels, interval, sfreq) -> (np.array, np.array):
             idx += 1
 
     return X, np.asarray(y)
+
+
+def _epoch_vectorized(Z, annotation, labels, interval, sfreq, copy):
+    """Epoch Z by gathering all trials from a window view in one step."""
+    Z = np.asarray(Z)
+    offsets, y = _event_offsets(annotation, labels, sfreq)
+    if len(offsets) == 0:
+        raise ValueError(
+            "Data does not contain trials that "
+            "correspond to any of the provided labels."
+        )
+    lower = int(interval[0] * sfreq)
+    n_timepoints = int(interval[1] * sfreq) - lower
+    starts = offsets + lower
+    if n_timepoints <= 0:
+        raise ValueError("interval must have a positive length")
+    if starts.min() < 0 or starts.max() + n_timepoints > Z.shape[0]:
+        raise ValueError("Interval around an event exceeds the recorded data.")
+
+    row_stride, channel_stride = Z.strides
+    if not copy:
+        steps = np.diff(starts)
+        if len(steps) == 0 or (steps[0] >= 0 and np.all(steps == steps[0])):
+            step = int(steps[0]) if len(steps) > 0 else 0
+            X = as_strided(
+                Z[starts[0] :],
+                shape=(len(starts), Z.shape[1], n_timepoints),
+                strides=(step * row_stride, channel_stride, row_stride),
+                writeable=False,
+            )
+            return X, y
+
+    # windows has shape (timepoints - n_timepoints + 1, channels, n_timepoints)
+    # and does not copy Z; indexing it with starts gathers all trials at once
+    windows = as_strided(
+        Z,
+        shape=(Z.shape[0] - n_timepoints + 1, Z.shape[1], n_timepoints),
+        strides=(row_stride, channel_stride, row_stride),
+        writeable=False,
+    )
+    # same C-contiguous float64 output as the loop
+    X = np.empty((len(starts), Z.shape[1], n_timepoints))
+    if Z.dtype == X.dtype:
+        np.take(windows, starts, axis=0, out=X)
+    else:
+        X[...] = windows[starts]
+    return X, y
+
+
+def _event_offsets(annotation, labels, sfreq):
+    """Return onsets in samples and labels of the events with one of labels."""
+    if isinstance(annotation, EventTable):
+        mask = annotation.mask(labels)
+        return annotation.sample_onsets(sfreq)[mask], annotation.description[mask]
+    mask = annotation["description"].isin(labels).to_numpy()
+    y = np.asarray(annotation["description"].to_numpy()[mask].tolist())
+    # same truncation towards zero as int() in the loop
+    offsets = (sfreq * annotation["onset"].to_numpy(dtype=float)[mask]).astype(
+        np.int64
+    )
+    return offsets, y
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+__all__ = ["StreamingEpocher"]
+
+import warnings
+
+import numpy as np
+from sktime.utils.validation.series import check_series
+
+from sktime_neuro.transformations.base import _SeriesToPanelTransformer
+from sktime_neuro.transformations.series_to_panel.eeg_epoching import (
+    _event_offsets,
+    epoch,
+)
+
+
+class StreamingEpocher(_SeriesToPanelTransformer):
+    """Epoch a series that arrives in chunks.
+
+    Samples are kept in a ring buffer of fixed length. Markers can be added
+    at any time, and every trial is returned by ``update`` as soon as its
+    interval around the marker has been recorded.
+
+    Parameters
+    ----------
+    labels : list of string
+        labels of events to create trials from
+    interval : tuple of float or int
+        time interval around event to select
+    sfreq : int or float
+        sampling frequency of the recorded data in Hz
+    buffer_length : int or float (default 10)
+        length of the ring buffer in seconds, must be at least
+        as long as the interval. Markers that arrive after their
+        data has left the buffer are dropped.
+    """
+
+    def __init__(self, labels, interval, sfreq, buffer_length=10):
+        self.labels = labels
+        self.interval = interval
+        self.sfreq = sfreq
+        self.buffer_length = buffer_length
+        if not (
+            isinstance(sfreq, (int, float)) & isinstance(buffer_length, (int, float))
+        ):
+            raise TypeError("sfreq and buffer_length need to be numbers.")
+        self._lower = int(interval[0] * sfreq)
+        self._n_timepoints = int(interval[1] * sfreq) - self._lower
+        self._buffer_size = int(buffer_length * sfreq)
+        if self._n_timepoints <= 0:
+            raise ValueError("interval must have a positive length")
+        if self._buffer_size < self._n_timepoints:
+            raise ValueError("buffer_length must be at least as long as the interval")
+        super(StreamingEpocher, self).__init__()
+
+    def fit(self, Z=None, X=None):
+        """Reset the stream.
+
+        Parameters
+        ----------
+        Z : ignored
+        X : ignored
+
+        Returns
+        -------
+        self : a fitted instance of the estimator
+        """
+        self._buffer = None
+        self._pending_starts = []
+        self._pending_labels = []
+        self.n_samples_seen_ = 0
+        self._is_fitted = True
+        return self
+
+    def add_events(self, annotation):
+        """Register markers of the stream.
+
+        Parameters
+        ----------
+        annotation : pd.DataFrame or EventTable,
+            one row per event with columns "onset" and "description",
+            onsets in seconds since the start of the stream
+        """
+        self.check_is_fitted()
+        offsets, labels = _event_offsets(annotation, self.labels, self.sfreq)
+        for start, label in zip(offsets + self._lower, labels):
+            if start < 0:
+                warnings.warn("Dropped event whose interval starts before the stream.")
+                continue
+            self._pending_starts.append(int(start))
+            self._pending_labels.append(label)
+
+    def update(self, Z, X=None):
+        """Append a chunk to the stream and return all completed trials.
+
+        Parameters
+        ----------
+        Z : np.array
+            next chunk of the series, shape: timepoints*channels
+        X : pd.DataFrame, EventTable or None (default None)
+            new markers, see ``add_events``
+
+        Returns
+        -------
+        Xt : np.array
+            panel data of the completed trials
+            (shape: trials, channels, timepoints)
+        y : np.array
+            labels vector
+        """
+        self.check_is_fitted()
+        if X is not None:
+            self.add_events(X)
+        Z = np.asarray(check_series(Z))
+        if Z.ndim == 1:
+            Z = Z.reshape(-1, 1)
+        if self._buffer is None:
+            self._buffer = np.zeros((self._buffer_size, Z.shape[1]), dtype=Z.dtype)
+        elif Z.shape[1] != self._buffer.shape[1]:
+            raise ValueError("Number of channels changed during the stream.")
+
+        # write in pieces, so that no completed trial is overwritten
+        # before it is read
+        piece = self._buffer_size - self._n_timepoints + 1
+        trials, y = [], []
+        for begin in range(0, max(Z.shape[0], 1), piece):
+            self._write(Z[begin : begin + piece])
+            Xt_piece, y_piece = self._emit()
+            trials.append(Xt_piece)
+            y.append(y_piece)
+        return np.concatenate(trials), np.concatenate(y)
+
+    def transform(self, Z, X=None):
+        """Epoch an entire recording at once.
+
+        Parameters
+        ----------
+        Z : np.array
+            time series to be epoched, shape: timepoints*channels
+        X : pd.DataFrame or EventTable,
+            one row per event with columns "onset", "duration"
+            and "description"
+
+        Returns
+        -------
+        Xt : np.array
+            panel data (shape: trials, channels, timepoints)
+        y : np.array
+            labels vector
+        """
+        self.check_is_fitted()
+        return epoch(Z, X, self.labels, self.interval, self.sfreq)
+
+    def _write(self, Z):
+        """Copy Z into the ring buffer."""
+        position = self.n_samples_seen_ % self._buffer_size
+        first = min(len(Z), self._buffer_size - position)
+        self._buffer[position : position + first] = Z[:first]
+        self._buffer[: len(Z) - first] = Z[first:]
+        self.n_samples_seen_ += len(Z)
+
+    def _emit(self):
+        """Read all completed trials from the buffer."""
+        starts = np.asarray(self._pending_starts, dtype=np.int64)
+        labels = np.asarray(self._pending_labels)
+        done = starts + self._n_timepoints <= self.n_samples_seen_
+        lost = done & (starts < self.n_samples_seen_ - self._buffer_size)
+        if lost.any():
+            warnings.warn(
+                f"Dropped {lost.sum()} events whose data already left the buffer."
+            )
+        self._pending_starts = list(starts[~done])
+        self._pending_labels = list(labels[~done])
+
+        keep = done & ~lost
+        index = (starts[keep, None] + np.arange(self._n_timepoints)) % self._buffer_size
+        # buffer[index] has shape trials*timepoints*channels
+        Xt = self._buffer[index].transpose(0, 2, 1)
+        return Xt, labels[keep]
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+__all__ = ["load_cached", "default_cache_dir", "load_dataset", "clear_dataset_cache"]
+
+import hashlib
+import json
+import os
+import shutil
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+from sktime.datasets import load_from_tsfile_to_dataframe
+
+from sktime_neuro.datasets.conversion.binary import load_npy_dataset, ts_to_npy_dataset
+
+# datasets parsed in this process, the most recently used last
+_datasets = OrderedDict()
+_max_datasets = 4
+
+
+def default_cache_dir(source):
+    """Return the default cache directory, next to the source file."""
+    return os.path.join(os.path.dirname(os.path.abspath(source)), ".sktime_neuro_cache")
+
+
+def load_cached(source, loader, name, cache_dir=None, validate="mtime", mmap_mode="c"):
+    """
+    Load the arrays read from a file, from an on-disk cache if it is up to date.
+
+    The first call reads source with loader and stores every array it returns
+    as .npy file, later calls load them memory mapped instead of parsing
+    source again. The cache is rebuilt when source changed.
+
+    Parameters
+    _________
+    source : str or list of str
+        path of the file to read, or of several files read together
+    loader : callable
+        function reading source, returns a dict of np.arrays,
+        arrays of dtype object are not supported
+    name : str
+        name of the loader, to keep the caches of different loaders of the
+        same file apart
+    cache_dir : str or None (default None)
+        directory to store the cache in, next to the source file if None
+    validate : str, "mtime" or "hash" (default "mtime")
+        "mtime" compares modification time and size of source,
+        "hash" compares the sha256 hash of its content,
+        the cache is rebuilt if any of the files in source changed
+    mmap_mode : str or None (default "c")
+        mmap_mode of ``np.load``, with "c" changes of the arrays are not
+        written back to the cache
+
+    Returns
+    ________
+    arrays : dict of np.array
+    """
+    arrays = {}
+
+    def build(directory):
+        arrays.update(loader(source))
+        for key, value in arrays.items():
+            np.save(os.path.join(directory, f"{key}.npy"), value, allow_pickle=False)
+        return {"arrays": list(arrays)}
+
+    entry, meta = _cached_entry(source, name, build, cache_dir, validate)
+    if meta["arrays"] and not arrays:
+        arrays = {
+            key: np.load(os.path.join(entry, f"{key}.npy"), mmap_mode=mmap_mode)
+            for key in meta["arrays"]
+        }
+    return arrays
+
+
+def _cached_entry(source, name, build, cache_dir=None, validate="mtime"):
+    """
+    Return the cache directory of source, built anew if source changed.
+
+    build(directory) writes the cache into the given directory and returns a
+    dict that is stored with the stamp of source in its meta.json.
+
+    Returns
+    ________
+    entry : str
+        the cache directory
+    meta : dict
+        content of its meta.json
+    """
+    if validate not in ("mtime", "hash"):
+        raise ValueError("validate must be either 'mtime' or 'hash'")
+    sources = [source] if isinstance(source, str) else list(source)
+    if cache_dir is None:
+        cache_dir = default_cache_dir(sources[0])
+    entry = os.path.join(cache_dir, f"{os.path.basename(sources[0])}.{name}")
+    meta_file = os.path.join(entry, "meta.json")
+    stamp = [_stamp(s, validate) for s in sources]
+
+    if os.path.exists(meta_file):
+        with open(meta_file) as f:
+            meta = json.load(f)
+        if meta["stamp"] == stamp:
+            return entry, meta
+
+    # write to a directory of this process first and move it in place at once,
+    # so that processes building the same cache do not read partial files
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    sources = [os.path.abspath(s) for s in sources]
+    meta = {"source": sources, "stamp": stamp, **build(tmp)}
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump(meta, f)
+    shutil.rmtree(entry, ignore_errors=True)
+    try:
+        os.rename(tmp, entry)
+    except OSError:
+        # another process put its cache in place first
+        shutil.rmtree(tmp, ignore_errors=True)
+    return entry, meta
+
+
+def _stamp(source, validate):
+    """Return what identifies the current version of source."""
+    if validate == "mtime":
+        stat = os.stat(source)
+        return [stat.st_mtime_ns, stat.st_size]
+    sha = hashlib.sha256()
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def load_dataset(file, cache_dir=None):
+    """
+    Load a .ts file, parsing it only once as long as it is not modified.
+
+    The parsed panel is kept in memory for later calls in the same process, and in
+    the binary format of ``sktime_neuro.datasets.conversion.binary`` in an on-disk
+    cache for other processes, both keyed by the path and the modification time of
+    the file. The returned objects are shared between calls, so they should not be
+    modified; they are memory mapped copy-on-write, so that changes only affect
+    this process and not the cache. If the cache cannot be written, e.g.
+    next to a file on a read-only file system, the file is parsed without it.
+
+    Parameters
+    _________
+    file : str
+        path of the .ts file
+    cache_dir : str or None (default None)
+        directory of the on-disk cache, next to the file if None
+
+    Returns
+    ________
+    X : pd.DataFrame
+        nested panel, like ``load_from_tsfile_to_dataframe`` returns it
+    y : np.array
+        class values
+    """
+    stat = os.stat(file)
+    key = (os.path.abspath(file), stat.st_mtime_ns, stat.st_size)
+    if key in _datasets:
+        _datasets.move_to_end(key)
+        return _datasets[key]
+    try:
+        entry, _ = _cached_entry(
+            file, "npy", lambda directory: _ts_to_npy(file, directory), cache_dir
+        )
+        _datasets[key] = load_npy_dataset(
+            entry, "panel", return_type="nested_univ", mmap_mode="c"
+        )
+    except OSError as e:
+        warnings.warn(f"Loading {file} without the dataset cache: {e}")
+        _datasets[key] = load_from_tsfile_to_dataframe(file)
+    while len(_datasets) > _max_datasets:
+        _datasets.popitem(last=False)
+    return _datasets[key]
+
+
+def clear_dataset_cache():
+    """Remove all datasets kept in memory by load_dataset."""
+    _datasets.clear()
+
+
+def _ts_to_npy(file, directory):
+    """Convert a .ts file to the binary format in directory."""
+    ts_to_npy_dataset(file, directory, "panel")
+    return {}
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+__all__ = ["EventTable"]
+
+import mne
+import numpy as np
+import pandas as pd
+
+
+class EventTable:
+    """
+    Compact table of events backed by numpy arrays.
+
+    Holds the same information as the annotation DataFrame with columns
+    "onset", "duration" and "description", but with onsets as sample
+    indices and descriptions coded as integers into a vocabulary of labels,
+    so selecting the events of some labels is one lookup per event.
+
+    Parameters
+    _________
+    onset : array-like of int
+        onsets of the events in samples
+    codes : array-like of int
+        label of each event as position in labels
+    labels : array-like
+        vocabulary of labels
+    sfreq : int or float
+        sampling frequency the onsets refer to in Hz
+    duration : array-like of float or None (default None)
+        durations of the events in seconds, zero if None
+    """
+
+    __slots__ = ("onset", "duration", "codes", "labels", "sfreq")
+
+    def __init__(self, onset, codes, labels, sfreq, duration=None):
+        self.onset = np.asarray(onset, dtype=np.int64)
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.labels = np.asarray(labels)
+        self.sfreq = sfreq
+        if duration is None:
+            self.duration = np.zeros(len(self.onset))
+        else:
+            self.duration = np.asarray(duration, dtype=float)
+        if not len(self.onset) == len(self.codes) == len(self.duration):
+            raise ValueError("onset, codes and duration must have the same length")
+        if len(self.codes) > 0 and (
+            self.codes.min() < 0 or self.codes.max() >= len(self.labels)
+        ):
+            raise ValueError("codes must be positions in labels")
+
+    @classmethod
+    def from_descriptions(cls, onset, description, sfreq, duration=None):
+        """
+        Create an event table from onsets in samples and descriptions.
+
+        Parameters
+        _________
+        onset : array-like of int
+            onsets of the events in samples
+        description : array-like
+            label of each event
+        sfreq : int or float
+            sampling frequency the onsets refer to in Hz
+        duration : array-like of float or None (default None)
+            durations of the events in seconds, zero if None
+
+        Returns
+        ________
+        events : EventTable
+        """
+        codes, labels = pd.factorize(np.asarray(description), sort=True)
+        return cls(onset, codes, np.asarray(labels), sfreq, duration)
+
+    @classmethod
+    def from_pandas(cls, annotation, sfreq):
+        """
+        Create an event table from an annotation DataFrame.
+
+        Parameters
+        _________
+        annotation : pd.DataFrame,
+            one row per event with columns "onset", "duration"
+            and "description", onsets in seconds
+        sfreq : int or float
+            sampling frequency of the recorded data in Hz
+
+        Returns
+        ________
+        events : EventTable
+        """
+        # same truncation towards zero as in epoching
+        onset = (sfreq * annotation["onset"].to_numpy(dtype=float)).astype(np.int64)
+        duration = annotation["duration"].to_numpy(dtype=float)
+        duration = np.where(np.isnan(duration), 0.0, duration)
+        description = annotation["description"]
+        if isinstance(description.dtype, pd.CategoricalDtype):
+            labels = np.asarray(description.cat.categories)
+            return cls(onset, description.cat.codes.to_numpy(), labels, sfreq, duration)
+        return cls.from_descriptions(onset, description.to_numpy(), sfreq, duration)
+
+    @classmethod
+    def from_mne(cls, raw):
+        """
+        Create an event table from the annotations of a raw-mne object.
+
+        Parameters
+        _________
+        raw : mne raw object
+
+        Returns
+        ________
+        events : EventTable
+        """
+        annotations = raw.annotations
+        sfreq = raw.info["sfreq"]
+        onset = (sfreq * annotations.onset).astype(np.int64)
+        return cls.from_descriptions(
+            onset, annotations.description, sfreq, annotations.duration
+        )
+
+    def to_pandas(self, categorical=True):
+        """
+        Convert to an annotation DataFrame.
+
+        Parameters
+        _________
+        categorical : bool (default True)
+            store the descriptions as categorical dtype
+
+        Returns
+        ________
+        annotation_pandas : pd.DataFrame
+            one row per event with columns
+            "onset", "duration" and "description", onsets in seconds
+        """
+        if categorical:
+            description = pd.Categorical.from_codes(self.codes, self.labels)
+        else:
+            description = self.description
+        return pd.DataFrame(
+            {
+                "onset": self.onset / self.sfreq,
+                "duration": self.duration,
+                "description": description,
+            }
+        )
+
+    def to_mne(self):
+        """
+        Convert to mne annotations.
+
+        Returns
+        ________
+        annotations : mne.Annotations
+        """
+        return mne.Annotations(
+            self.onset / self.sfreq,
+            self.duration,
+            self.description.astype(str),
+        )
+
+    @property
+    def description(self):
+        """Label of each event."""
+        return self.labels[self.codes]
+
+    def __len__(self):
+        return len(self.onset)
+
+    def __repr__(self):
+        return (
+            f"EventTable(n_events={len(self)}, labels={list(self.labels)}, "
+            f"sfreq={self.sfreq})"
+        )
+
+    def mask(self, labels):
+        """Return a boolean mask of the events with one of the given labels."""
+        lookup = np.isin(self.labels, labels)
+        return lookup[self.codes]
+
+    def select(self, labels):
+        """Return a new event table with only the events of the given labels."""
+        mask = self.mask(labels)
+        return EventTable(
+            self.onset[mask],
+            self.codes[mask],
+            self.labels,
+            self.sfreq,
+            self.duration[mask],
+        )
+
+    def sample_onsets(self, sfreq=None):
+        """
+        Return the onsets in samples at sampling frequency sfreq.
+
+        Parameters
+        _________
+        sfreq : int, float or None (default None)
+            sampling frequency in Hz, the one of the table if None
+
+        Returns
+        ________
+        onset : np.array of int64
+        """
+        if sfreq is None or sfreq == self.sfreq:
+            return self.onset
+        return (self.onset * (sfreq / self.sfreq)).astype(np.int64)
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+__all__ = [
+    "design_filter",
+    "apply_filter",
+    "apply_filter_batched",
+    "is_causal",
+    "resampling_factors",
+    "filter_cache_info",
+    "clear_filter_cache",
+]
+
+import threading
+import warnings
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+import numpy as np
+from mne import filter
+from scipy import signal
+
+# keyword arguments of ``mne.filter.filter_data`` that define the filter,
+# all others (e.g. picks, n_jobs, copy, pad) only affect how it is applied
+_design_defaults = {
+    "filter_length": "auto",
+    "l_trans_bandwidth": "auto",
+    "h_trans_bandwidth": "auto",
+    "method": "fir",
+    "iir_params": None,
+    "phase": "zero",
+    "fir_window": "hamming",
+    "fir_design": "firwin",
+    "verbose": None,
+}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_cache_maxsize = 128
+_cache = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+_cache_lock = threading.Lock()
+
+
+def design_filter(sfreq, l_freq, h_freq, **kwargs):
+    """
+    Design a filter like ``mne.filter.filter_data`` would.
+
+    Designed filters are kept in a least recently used cache that is shared
+    by all transformers, so a filter with the same sfreq, frequencies and
+    design parameters is only designed once.
+
+    Parameters
+    _________
+    sfreq : int or float
+        sampling frequency of the recorded data in Hz
+    l_freq : float or None
+        lower pass-band edge
+    h_freq : float or None
+        upper pass-band edge
+    **kwargs
+        keyword arguments of ``mne.filter.filter_data``,
+        arguments that do not affect the design are ignored
+
+    Returns
+    ________
+    filt : np.array or dict
+        FIR coefficients for method="fir",
+        dict with IIR parameters for method="iir"
+    """
+    design_kwargs = {k: kwargs.get(k, v) for k, v in _design_defaults.items()}
+    if isinstance(design_kwargs["iir_params"], dict):
+        # mne adds the coefficients to the dict it gets passed
+        design_kwargs["iir_params"] = dict(design_kwargs["iir_params"])
+    key = _freeze((sfreq, l_freq, h_freq, design_kwargs))
+
+    with _cache_lock:
+        filt = _cache.get(key)
+        if filt is not None:
+            _cache.move_to_end(key)
+            _cache_stats["hits"] += 1
+    if filt is None:
+        filt = filter.create_filter(None, sfreq, l_freq, h_freq, **design_kwargs)
+        with _cache_lock:
+            _cache_stats["misses"] += 1
+            _cache[key] = filt
+            while len(_cache) > _cache_maxsize:
+                _cache.popitem(last=False)
+    return _copy_filter(filt)
+
+
+def apply_filter(data, filt, **kwargs):
+    """
+    Apply a designed filter like ``mne.filter.filter_data`` would.
+
+    Parameters
+    _________
+    data : np.array
+        data to be filtered, timepoints need to be the last dimension
+    filt : np.array or dict
+        filter returned by ``design_filter``
+    **kwargs
+        keyword arguments of ``mne.filter.filter_data``,
+        the design arguments must be the ones ``filt`` was designed with
+
+    Returns
+    ________
+    data : np.array
+        filtered data
+    """
+    # these are the helpers filter_data dispatches to after designing
+    data = filter._check_filterable(data)
+    phase = kwargs.get("phase", "zero")
+    picks = kwargs.get("picks")
+    n_jobs = kwargs.get("n_jobs")
+    copy = kwargs.get("copy", True)
+    if isinstance(filt, dict):
+        return filter._iir_filter(data, filt, picks, n_jobs, copy, phase)
+    if len(filt) > data.shape[-1]:
+        # mne only checks this when it gets to see the data while designing
+        warnings.warn(
+            f"filter_length ({len(filt)}) is longer than the signal "
+            f"({data.shape[-1]}), distortion is likely. Reduce filter length "
+            "or filter a longer signal.",
+            RuntimeWarning,
+        )
+    pad = kwargs.get("pad", "reflect_limited")
+    return filter._overlap_add_filter(data, filt, None, phase, picks, n_jobs, copy, pad)
+
+
+def apply_filter_batched(data, filt, dtype=np.float64, out=None, **kwargs):
+    """
+    Apply a designed filter to all rows of data in one vectorized call.
+
+    Gives the same result as ``apply_filter``, but instead of filtering one
+    row after the other, all rows are filtered at once by a batched
+    overlap-add FFT convolution (FIR) or ``sosfiltfilt``/``filtfilt``
+    along the last axis (IIR).
+
+    Parameters
+    _________
+    data : np.array
+        data to be filtered, timepoints need to be the last dimension
+    filt : np.array or dict
+        filter returned by ``design_filter``
+    dtype : np.float64 or np.float32 (default np.float64)
+        precision the filter is computed in
+    out : np.array or None (default None)
+        C-contiguous array of the shape of data and type dtype to write the
+        result to. The rows are then filtered in blocks that are written to
+        out one after the other, so only the intermediate arrays of one
+        block are held in memory besides data and out.
+    **kwargs
+        keyword arguments of ``mne.filter.filter_data``,
+        the design arguments must be the ones ``filt`` was designed with,
+        picks and n_jobs are not supported
+
+    Returns
+    ________
+    data : np.array
+        filtered data
+    """
+    if kwargs.get("picks") is not None:
+        raise ValueError("picks are not supported when filtering in one batch")
+    if kwargs.get("n_jobs") not in (None, 1):
+        raise ValueError("n_jobs is not supported when filtering in one batch")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("Filters can only be computed in float32 or float64")
+    data = np.asarray(data)
+    shape = data.shape
+    if out is not None and (out.shape != shape or out.dtype != dtype):
+        raise ValueError("out needs to have the shape of data and type dtype")
+    if out is not None and not out.flags.c_contiguous:
+        raise ValueError("out needs to be C-contiguous")
+    x = data.reshape(-1, shape[-1])
+
+    if out is None:
+        # astype only copies if needed
+        xt = _filter_rows(x.astype(dtype, copy=False), filt, dtype, **kwargs)
+        return xt.astype(dtype, copy=False).reshape(shape)
+    out_rows = out.reshape(-1, shape[-1])
+    n_edge = 0 if isinstance(filt, dict) else len(filt) - 1
+    # the convolution holds a few arrays of the padded length per row
+    block = max(1, _block_bytes // (4 * (shape[-1] + 2 * n_edge) * dtype.itemsize))
+    for start in range(0, len(x), block):
+        rows = x[start : start + block].astype(dtype, copy=False)
+        out_rows[start : start + block] = _filter_rows(rows, filt, dtype, **kwargs)
+    return out
+
+
+# memory the intermediate arrays of one block of rows may take when filtering
+# into a given output array
+_block_bytes = 1 << 26
+
+
+def _filter_rows(x, filt, dtype, **kwargs):
+    """Filter the rows of the 2D array x along the last axis."""
+    n_times = x.shape[1]
+    phase = kwargs.get("phase", "zero")
+
+    if isinstance(filt, dict):
+        coefs = {k: filt[k].astype(dtype) for k in ("sos", "b", "a") if k in filt}
+        if phase in ("zero", "zero-double"):
+            padlen = min(filt["padlen"], n_times - 1)
+            if "sos" in coefs:
+                return signal.sosfiltfilt(coefs["sos"], x, axis=-1, padlen=padlen)
+            return signal.filtfilt(coefs["b"], coefs["a"], x, axis=-1, padlen=padlen)
+        if "sos" in coefs:
+            return signal.sosfilt(coefs["sos"], x, axis=-1)
+        return signal.lfilter(coefs["b"], coefs["a"], x, axis=-1)
+
+    # same edge padding and delay compensation as mne's overlap-add
+    h = filt.astype(dtype)
+    n_edge = max(min(len(h), n_times) - 1, 0)
+    pad = kwargs.get("pad", "reflect_limited")
+    if n_edge == 0:
+        x_ext = x
+    elif pad == "reflect_limited":
+        x_ext = np.concatenate(
+            [
+                2 * x[:, :1] - x[:, n_edge:0:-1],
+                x,
+                2 * x[:, -1:] - x[:, -2 : -n_edge - 2 : -1],
+            ],
+            axis=-1,
+        )
+    else:
+        x_ext = np.pad(x, ((0, 0), (n_edge, n_edge)), pad)
+    if phase == "zero-double":
+        h = np.convolve(h, h[::-1])
+    shift = ((len(h) - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+    xt = signal.oaconvolve(x_ext, h[np.newaxis, :], mode="full", axes=-1)
+    return xt[:, shift : shift + n_times]
+
+
+def is_causal(**kwargs):
+    """
+    Check whether the filter defined by the ``filter_data`` kwargs is causal.
+
+    Only minimum-phase FIR filters and forward IIR filters depend on past
+    samples alone and can be applied to a stream chunk by chunk.
+    """
+    method = kwargs.get("method", "fir")
+    phase = kwargs.get("phase", "zero")
+    return (method == "fir" and phase == "minimum") or (
+        method == "iir" and phase == "forward"
+    )
+
+
+def resampling_factors(fs, target_fs, max_denominator=1000):
+    """
+    Approximate target_fs / fs by a fraction up / down.
+
+    Parameters
+    _________
+    fs : int or float
+        sampling frequency of the recorded data in Hz
+    target_fs : int or float
+        sampling frequency to resample to in Hz
+    max_denominator : int (default 1000)
+        largest down factor to consider
+
+    Returns
+    ________
+    up : int
+        upsampling factor
+    down : int
+        downsampling factor
+    """
+    ratio = (Fraction(target_fs) / Fraction(fs)).limit_denominator(max_denominator)
+    return ratio.numerator, ratio.denominator
+
+
+def filter_cache_info():
+    """Return hits, misses, maxsize and current size of the filter cache."""
+    with _cache_lock:
+        return CacheInfo(
+            _cache_stats["hits"], _cache_stats["misses"], _cache_maxsize, len(_cache)
+        )
+
+
+def clear_filter_cache():
+    """Remove all designed filters from the cache and reset its statistics."""
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
+
+def _freeze(value):
+    """Turn value into something hashable to be used as cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    return value
+
+
+def _copy_filter(filt):
+    """Copy a cached filter, so the cache cannot be modified by the caller."""
+    if isinstance(filt, dict):
+        return {
+            k: v.copy() if isinstance(v, np.ndarray) else v for k, v in filt.items()
+        }
+    return filt.copy()
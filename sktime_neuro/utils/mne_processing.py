@@ -1,19 +1,27 @@
 # -*- coding: utf-8 -*-
 __author__ = ["Svea Marie Meyer"]
 
+from contextlib import nullcontext
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 import mne
 from sktime.utils.validation.series import check_series
 
 
-def create_annotation(raw):
+def create_annotation(raw, categorical=True, sample_index=False):
     """
     Create sktime_neuro annotation from raw-mne object.
 
     Parameters
     _________
     raw : mne raw object
+    categorical : bool (default True)
+        store the descriptions as categorical dtype
+    sample_index : bool (default False)
+        add columns "onset_sample" and "duration_sample" with onset and
+        duration in samples, using the sampling frequency of raw
 
     Returns
     ________
@@ -22,13 +30,26 @@ def create_annotation(raw):
         "onset", "duration" and "descritption"
 
     """
-    annotation_pandas = pd.DataFrame(columns=["onset", "duration", "description"])
-    for idx, event in enumerate(raw.annotations):
-        annotation_pandas.loc[idx] = [
-            event["onset"],
-            event["duration"],
-            event["description"],
-        ]
+    annotations = raw.annotations
+    description = annotations.description
+    if categorical:
+        description = pd.Categorical(description)
+    annotation_pandas = pd.DataFrame(
+        {
+            "onset": annotations.onset,
+            "duration": annotations.duration,
+            "description": description,
+        }
+    )
+    if sample_index:
+        sfreq = raw.info["sfreq"]
+        # same truncation as in epoching
+        annotation_pandas["onset_sample"] = (sfreq * annotations.onset).astype(
+            np.int64
+        )
+        annotation_pandas["duration_sample"] = (
+            sfreq * annotations.duration
+        ).astype(np.int64)
     return annotation_pandas
 
 
@@ -36,10 +57,16 @@ def create_mne_raw(series, s_freq, ch_names=None, highpassed=True, **kwargs):
     """
     Create mne raw object from a series.
 
+    A C-contiguous float64 array of shape channels*timepoints is wrapped by
+    the raw object without copying, so changing one changes the other.
+    The mne Info is only created once for each channel layout and
+    sampling frequency.
+
     Parameters
     _________
     series : pd.Series, pd.DataFrame, np.array
-        recorded data
+        recorded data, np.array with shape channels*timepoints,
+        pd.DataFrame with shape timepoints*channels
     s_freq : int or float
         sampling frequency of the recorded data in Hz
     ch_names : List of strings
@@ -61,24 +88,38 @@ def create_mne_raw(series, s_freq, ch_names=None, highpassed=True, **kwargs):
     if isinstance(series, pd.DataFrame):
         if ch_names is None:
             ch_names = list(series.columns)
-        ch_types = ["eeg"] * len(ch_names)
-        data = series[ch_names].to_numpy()
+        elif list(ch_names) != list(series.columns):
+            series = series[ch_names]
+        # a DataFrame of one dtype keeps its values as channels*timepoints,
+        # so the transpose usually is a view of them
+        data = series.to_numpy(dtype=np.float64).T
 
     elif isinstance(series, np.ndarray):
-        ch_types = ["eeg"] * series.shape[0]
         if ch_names is None:
-            integer_names = list(range(series.shape[0]))
-            ch_names = [str(x) for x in integer_names]
+            ch_names = [str(x) for x in range(series.shape[0])]
         data = series
 
     else:  # its a pd.Series
-        ch_types = ["eeg"]
-        if series.ch_names is None:
-            series.ch_names = ["0"]
-        data = series
+        if ch_names is None:
+            ch_names = ["0" if series.name is None else str(series.name)]
+        data = series.to_numpy(dtype=np.float64)[np.newaxis, :]
+
+    info = _create_info(
+        tuple(ch_names), s_freq, tuple(sorted(kwargs.items())), highpassed
+    )
+    # RawArray copies the info and only copies data that is not float64
+    return mne.io.RawArray(data, info)
+
 
-    info = mne.create_info(ch_names=ch_names, ch_types=ch_types, sfreq=s_freq, **kwargs)
-    mne_raw = mne.io.RawArray(data, info)
+@lru_cache(maxsize=32)
+def _create_info(ch_names, s_freq, kwargs, highpassed):
+    """Create an mne Info for eeg channels, cached by channel layout."""
+    ch_types = ["eeg"] * len(ch_names)
+    info = mne.create_info(
+        ch_names=list(ch_names), ch_types=ch_types, sfreq=s_freq, **dict(kwargs)
+    )
     if highpassed:
-        mne_raw.info["highpass"] = 1
-    return mne_raw
+        # mne>=1.0 only allows to set highpass in the unlocked state
+        with getattr(info, "_unlock", nullcontext)():
+            info["highpass"] = 1
+    return info